@@ -8,11 +8,26 @@ if not world:
     st.warning("No world in session. Go to main page first.")
     st.stop()
 
-occ = world.grid.render_occupancy(size=96)
+# LOD tile pyramid: lives on world.grid, so tiles stay cached across reruns
+pyramid = world.grid.tile_pyramid()
+
+c1, c2, c3 = st.columns(3)
+with c1:
+    zoom = st.select_slider("Zoom", options=[1, 2, 4, 8, 16, 32, 64, 128], value=1)
+with c2:
+    pan_x = st.slider("Pan X (m)", min_value=-pyramid.size_m / 2, max_value=pyramid.size_m / 2, value=0.0)
+with c3:
+    pan_y = st.slider("Pan Y (m)", min_value=-pyramid.size_m / 2, max_value=pyramid.size_m / 2, value=0.0)
+
+cx = pyramid.origin_xy[0] + pyramid.size_m / 2 + pan_x
+cy = pyramid.origin_xy[1] + pyramid.size_m / 2 + pan_y
+occ = pyramid.render_view(center=(cx, cy), zoom=float(zoom), size=256)
+
 fig, ax = plt.subplots()
-ax.imshow(occ, interpolation="nearest")
+ax.imshow(occ, interpolation="nearest", origin="lower")
 ax.axis("off")
 st.pyplot(fig, use_container_width=True)
+st.caption(f"tiles cached: {pyramid.snapshot()['cached_tiles']} · built: {pyramid.snapshot()['built_tiles']}")
 
 st.subheader("Places")
-st.json(list(world.places.keys()))
\ No newline at end of file
+st.json(list(world.places.keys()))
@@ -1,4 +1,5 @@
 import streamlit as st
+import matplotlib.pyplot as plt
 
 st.set_page_config(layout="wide")
 st.title("Sensory Fields — Sound & Light")
@@ -8,9 +9,37 @@ if not world:
     st.warning("Advance the world from the Manager page.")
     st.stop()
 
-for scout in world.scouts:
-    snap = scout.snapshot()
+# scout snapshots from the last frame's record (read-only grid views)
+record = world.snapshot_bus.latest
+for snap in record.from_source("scout") if record else []:
     with st.expander(f"{snap.get('name')} ({snap.get('mode')})"):
         st.json(snap.get("summary"))
         st.write("Grid (intensity map):")
-        st.dataframe(snap.get("grid", []))
\ No newline at end of file
+        st.dataframe(snap.get("grid", []))
+
+st.subheader("Levels at agents")
+located = [a for a in world.agents if getattr(a, "position", None) is not None]
+if located:
+    points = [tuple(a.position) for a in located]
+    sound = world.levels_at("sound", points)
+    light = world.levels_at("light", points)
+    st.dataframe([
+        {"agent": a.name, "position": [round(v, 2) for v in p], "sound": float(s), "light": float(l)}
+        for a, p, s, l in zip(located, points, sound, light)
+    ])
+else:
+    st.caption("No positioned agents.")
+
+st.subheader("Neighbourhood field (tiled)")
+mode = st.radio("Channel", ["sound", "light"], horizontal=True)
+zoom = st.slider("Zoom", min_value=1, max_value=64, value=1)
+tiles = world.field_tiles(mode)
+if tiles is None:
+    st.info("No places to cover yet.")
+else:
+    img = tiles.render_view(world, zoom=float(zoom), size=256)
+    fig, ax = plt.subplots()
+    ax.imshow(img, interpolation="nearest", origin="lower")
+    ax.axis("off")
+    st.pyplot(fig, use_container_width=True)
+    st.json(tiles.snapshot())
@@ -1,15 +1,82 @@
+import os
+
 import streamlit as st
 
+from world_core.ledger_segments import SegmentReader, INDEX_FILE, LEDGER_RUNS_DIR
+
 st.set_page_config(layout="wide")
 st.title("Ledger Inspector")
 
 world = st.session_state.get("world")
-if not world:
-    st.warning("Advance the world first.")
+if world:
+    st.subheader("Ledger Metrics (Sandy’s Law)")
+    st.json(world.ledger.snapshot())
+
+    st.subheader("Recent Ledger Events")
+    st.json(world.ledger.tail(50))
+
+    st.subheader("Query")
+    c1, c2, c3 = st.columns(3)
+    kind = c1.selectbox("Kind", ["(any)"] + list(world.ledger.kinds))
+    source = c2.selectbox("Source", ["(any)"] + list(world.ledger.sources))
+    last_frame = int(world.frame)
+    frames = c3.slider("Frames", 0, max(1, last_frame), (max(0, last_frame - 500), max(1, last_frame)))
+    kind = None if kind == "(any)" else kind
+    source = None if source == "(any)" else source
+    st.caption(f"{world.ledger.count(kind=kind, source=source, frames=frames)} matching events")
+    st.json(world.ledger.query(kind=kind, source=source, frames=frames, limit=50))
+
+    buckets = world.ledger.counts_by_bucket(bucket=50, frames=frames)
+    if buckets:
+        st.bar_chart(buckets)
+    world.ledger.flush()  # make the live run readable from disk below
+else:
+    st.info("No live world in session — showing recorded runs only.")
+
+# ==================================================
+# Recorded history (memory-mapped segments on disk)
+# ==================================================
+st.divider()
+st.subheader("Recorded history")
+
+runs = []
+if os.path.isdir(LEDGER_RUNS_DIR):
+    runs = sorted(
+        (d for d in os.listdir(LEDGER_RUNS_DIR) if os.path.exists(os.path.join(LEDGER_RUNS_DIR, d, INDEX_FILE))),
+        reverse=True,
+    )
+if not runs:
+    st.info("No recorded ledger runs yet.")
     st.stop()
 
-st.subheader("Ledger Metrics (Sandy’s Law)")
-st.json(world.ledger.snapshot())
+run = st.selectbox("Run", runs)
+reader = SegmentReader(os.path.join(LEDGER_RUNS_DIR, run))
+st.json(reader.snapshot())
+
+if len(reader) == 0:
+    st.stop()
+
+h1, h2 = st.columns(2)
+h_kind = h1.selectbox("Kind filter", ["(any)"] + list(reader.kinds))
+h_source = h2.selectbox("Source filter", ["(any)"] + list(reader.sources))
+h_kind = None if h_kind == "(any)" else h_kind
+h_source = None if h_source == "(any)" else h_source
+
+page_size = 50
+if h_kind is None and h_source is None:
+    n_hits = len(reader)
+    hits = None
+else:
+    hits = reader.select(kind=h_kind, source=h_source)
+    n_hits = len(hits)
+    if n_hits == 0:
+        st.info("No events match.")
+        st.stop()
 
-st.subheader("Recent Ledger Events")
-st.json(world.ledger.tail(50))
\ No newline at end of file
+pages = max(1, (n_hits + page_size - 1) // page_size)
+page = st.number_input("Page (newest = last)", min_value=1, max_value=pages, value=pages, step=1)
+start = (int(page) - 1) * page_size
+if hits is None:
+    st.json(reader.records(start, start + page_size))
+else:
+    st.json([reader.record(int(i)) for i in hits[start:start + page_size]])
@@ -4,6 +4,7 @@ import matplotlib.pyplot as plt
 
 from world_core.bootstrap import build_world
 from world_core.world_space import WEATHER_DEFAULTS
+from world_core.ledger_segments import new_run_dir
 from world_core.world_clock import WorldClock  # if you already have this file; else use fallback below
 
 
@@ -23,7 +24,6 @@ except NameError:
         def tick(self, minutes: int = 1):
             self.world_datetime = self.world_datetime + timedelta(minutes=int(minutes))
 
-
 st.set_page_config(page_title="SLEDWorld — Manager Dashboard", layout="wide")
 st.title("SLEDWorld — Manager Dashboard")
 st.caption("Reality → Sensors → Investigator → Ledger → Gates → (Manager approvals) → Higher layers")
@@ -35,7 +35,8 @@ if "clock" not in st.session_state:
     st.session_state.clock = WorldClock(acceleration=1)
 
 if "world" not in st.session_state:
-    st.session_state.world = build_world(st.session_state.clock)
+    # every world spills its ledger to its own run dir (survives "Reset World")
+    st.session_state.world = build_world(st.session_state.clock, ledger_dir=new_run_dir())
 
 clock = st.session_state.clock
 world = st.session_state.world
@@ -56,9 +57,11 @@ with colC:
         for _ in range(int(advance_steps)):
             clock.tick(minutes=int(step_minutes))
             world.tick()
+        world.ledger.flush()  # keep the on-disk history current between clicks
 
 with colD:
     if st.button("Reset World (hard)", use_container_width=True):
+        world.ledger.flush()  # don't lose buffered history with the world
         st.session_state.pop("world", None)
         st.session_state.pop("clock", None)
         st.rerun()
@@ -136,7 +139,17 @@ left, right = st.columns([1.0, 1.2])
 
 with left:
     st.markdown("### World Aerial (occupancy)")
-    occ = world.grid.render_occupancy(size=64)  # 0..1
+    v1, v2 = st.columns(2)
+    with v1:
+        focus = st.selectbox("Centre on", ["(whole world)"] + list(world.places.keys()))
+    with v2:
+        zoom = st.number_input("Zoom", min_value=1.0, max_value=64.0, value=1.0, step=1.0)
+    center = None
+    if focus in world.places and world.places[focus].bounds:
+        (bx0, by0, _), (bx1, by1, _) = world.places[focus].bounds
+        center = ((bx0 + bx1) / 2, (by0 + by1) / 2)
+    # LOD tile pyramid (cached on world.grid, shared with the World Map page)
+    occ = world.grid.tile_pyramid().render_view(center=center, zoom=float(zoom), size=128)  # 0..1
     fig, ax = plt.subplots()
     ax.imshow(occ, interpolation="nearest")
     ax.axis("off")
@@ -185,15 +198,16 @@ st.divider()
 # ==================================================
 st.subheader("Bots (compact snapshots)")
 
-for a in world.agents:
-    if hasattr(a, "snapshot"):
-        snap = a.snapshot()
-        with st.expander(f"{snap.get('source','agent')} · {snap.get('name', a.__class__.__name__)}", expanded=False):
-            st.json(snap)
+# agents publish deltas; show the investigator's merged view of each
+for (source, name), snap in world.investigator.producer_states().items():
+    with st.expander(f"{source or 'agent'} · {name or 'agent'}", expanded=False):
+        st.json(snap)
+
+# everything else published on the last frame (same record the investigator read)
+record = world.snapshot_bus.latest
 
 st.subheader("Scouts")
-for s in world.scouts:
-    snap = s.snapshot()
+for snap in record.from_source("scout") if record else []:
     with st.expander(f"{snap.get('source','scout')} · {snap.get('name','Scout')}", expanded=False):
         st.json({k: v for k, v in snap.items() if k != "grid"})  # don't dump huge grids
 
@@ -0,0 +1,79 @@
+import random
+
+import pytest
+
+from world_core.bootstrap import build_world
+from world_core.delta_snapshot import DeltaEncoder, DeltaState
+from world_core.observer_bot import ObserverBot
+from world_core.walker_bot import WalkerBot
+from world_core.world_clock import WorldClock
+
+
+@pytest.mark.parametrize("keyframe_every", [1, 3, 100])
+def test_encoder_state_round_trip(keyframe_every):
+    rng = random.Random(keyframe_every)
+    encoder = DeltaEncoder(keyframe_every=keyframe_every)
+    state = DeltaState()
+    full = {"a": 0, "b": {"x": 0, "y": 0}}
+    for frame in range(300):
+        fields = {"source": "p", "name": "p-1", "frame": frame}
+        a_moved = rng.random() < 0.3
+        if a_moved:
+            full["a"] = rng.randint(0, 3)
+        moved = rng.choice("xy") if rng.random() < 0.3 else None
+        if moved:
+            full["b"] = dict(full["b"], **{moved: rng.randint(0, 3)})
+
+        # between keyframes, fields (and sub-keys) that didn't move may be left out
+        keyframe = encoder.keyframe_due
+        if keyframe or a_moved or rng.random() < 0.5:
+            fields["a"] = full["a"]
+        if keyframe or rng.random() < 0.5:
+            fields["b"] = dict(full["b"])
+        elif moved:
+            fields["b"] = {moved: full["b"][moved]}
+        points = [(frame % 32, 1)] if rng.random() < 0.2 else []
+        fields["points_xy"] = points
+
+        view = state.apply(encoder.encode(fields))
+        expected = {"source": "p", "name": "p-1", "frame": frame, "a": full["a"], "b": full["b"]}
+        if points:
+            expected["points_xy"] = points
+        assert view == expected
+
+
+@pytest.mark.parametrize("seed", [1, 2])
+def test_producer_views_equal_full_snapshots(seed):
+    random.seed(seed)
+    clock = WorldClock(acceleration=1)
+    world = build_world(clock)
+    for agent in world.agents:
+        if isinstance(agent, (WalkerBot, ObserverBot)):
+            agent._delta = DeltaEncoder(keyframe_every=7)
+
+    interactions = 0
+    for _ in range(200):
+        clock.tick(minutes=1)
+        world.tick()
+        states = world.investigator.producer_states()
+        for agent in world.agents:
+            if isinstance(agent, WalkerBot):
+                assert agent.snapshot() is agent.snapshot()  # encoded once per tick
+                assert states[("walker", agent.name)] == {
+                    "source": "walker",
+                    "name": agent.name,
+                    "frame": world.frame,
+                    "position_xyz": [round(v, 2) for v in agent.position],
+                    "current_area": agent.current_area,
+                    "speed_m_per_min": agent.speed_m_per_min,
+                }
+                interactions += bool(agent.last_interaction)
+            elif isinstance(agent, ObserverBot):
+                assert states[("observer", agent.name)] == {
+                    "source": "observer",
+                    "name": agent.name,
+                    "frame": world.frame,
+                    "world_space": world.space.snapshot(),
+                    "places_seen": list(world.places.keys())[:10],
+                }
+    assert interactions > 0
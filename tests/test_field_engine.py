@@ -0,0 +1,22 @@
+import numpy as np
+import pytest
+
+from world_core.bootstrap import build_world
+from world_core.field_engine import grid_axes
+from world_core.scout_bot import ScoutBot
+from world_core.world_clock import WorldClock
+
+
+@pytest.mark.parametrize("mode", ["sound", "light"])
+def test_levels_at_matches_scout_grid(mode):
+    world = build_world(WorldClock(acceleration=1))
+    for obj in world.emitters_of("sound"):
+        obj.power_toggle()
+    center = tuple(world.emitters_of(mode)[0].position)
+    scout = ScoutBot(name="Scout", mode=mode, center_xyz=center)
+    scout.observe(world)
+
+    n, xs, ys = grid_axes(center, scout.extent_m, scout.resolution_m)
+    points = [(x, y, center[2]) for y in ys for x in xs]
+    levels = world.levels_at(mode, points).reshape(n, n)
+    assert np.allclose(levels, scout.grid, atol=1e-12)
@@ -0,0 +1,22 @@
+from world_core.bootstrap import build_world
+from world_core.investigator_bot import InvestigatorBot
+from world_core.scout_bot import ScoutBot
+from world_core.world_clock import WorldClock
+
+
+def _events(snaps):
+    return [(e.frame, e.source, e.kind, e.payload) for e in InvestigatorBot().ingest_snapshots(1, snaps)]
+
+
+def test_multi_scout_snapshot_gives_channel_events():
+    clock = WorldClock(acceleration=1)
+    world = build_world(clock)
+    for obj in world.emitters_of("sound"):
+        obj.power_toggle()  # sound on as well as the standby light
+    center = tuple(world.emitters_of("sound")[0].position)
+    scout = ScoutBot(name="Scout", mode="multi", channels=("sound", "light"), center_xyz=center)
+    scout.observe(world)
+
+    per_channel = _events(scout.channel_snapshots())
+    assert {kind for _, _, kind, _ in per_channel} == {"sound_peaks", "light_peaks"}
+    assert _events([scout.snapshot()]) == per_channel
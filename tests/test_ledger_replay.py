@@ -0,0 +1,95 @@
+import random
+
+import numpy as np
+import pytest
+
+from world_core.ledger import Ledger, LedgerEvent
+from world_core.ledger_gates import GATE_FLAGS, GATE_SCORES, GateParams
+from world_core.ledger_replay import ReplayLog, coherence_series, first_open_frames, replay_gates
+from world_core.sandys_square import coherence_gate
+
+KINDS = [
+    ("walker", "walker_interaction"),
+    ("scout:sound", "sound_peaks"),
+    ("scout:light", "light_peaks"),
+    ("surveyor", "surface_points"),
+    ("language", "language_event"),
+]
+
+PARAMS = [
+    GateParams(),
+    GateParams(window=50, max_points=100, symbol_threshold=0.5),
+    GateParams(grid_size=16, walker_norm=3, language_threshold=0.6),
+]
+
+
+def _random_payload(rng, kind):
+    if kind == "language_event":
+        return {"source": "language", "event": "symbol_emitted"}
+    cx, cy = rng.randint(0, 31), rng.randint(0, 31)
+    pts = [(min(40, max(-3, cx + rng.randint(-3, 3))), min(31, max(0, cy + rng.randint(-3, 3))))
+           for _ in range(rng.randint(0, 12))]
+    if rng.random() < 0.05:
+        pts = [(x + 0.5, y) for x, y in pts]  # stays in the JSON extras
+    if kind == "walker_interaction":
+        return {"interaction": "remote:power_toggle", "points_xy": pts}
+    return {"points_xy": pts}
+
+
+@pytest.mark.parametrize("seed", [1, 2])
+def test_replay_matches_live_gates(tmp_path, seed):
+    rng = random.Random(seed)
+    ledgers = [Ledger(spill_dir=str(tmp_path) if i == 0 else None, gate_params=p) for i, p in enumerate(PARAMS)]
+    live = [[] for _ in PARAMS]
+    frames = []
+    for frame in range(1, 1500):
+        n = rng.randint(0, 4)
+        for _ in range(n):
+            source, kind = rng.choice(KINDS)
+            payload = _random_payload(rng, kind)
+            for ledger in ledgers:
+                ledger.ingest(LedgerEvent(frame, source, kind, payload))
+        if n:
+            frames.append(frame)
+            for ledger, out in zip(ledgers, live):
+                ledger.recompute_gates()
+                out.append(ledger.gates_snapshot())
+
+    result = replay_gates(ReplayLog.from_segments(ledgers[0].history()), PARAMS)
+    assert result["frames"].tolist() == frames
+    for s, snaps in enumerate(live):
+        for j, gates in enumerate(snaps):
+            for name in GATE_SCORES:
+                assert result[name][s, j] == pytest.approx(gates[name], abs=1e-9)
+            for name in GATE_FLAGS:
+                assert bool(result[name][s, j]) == gates[name]
+
+    # the event-dict path gives the same answer as the memory-mapped one
+    history = ledgers[0].history()
+    again = replay_gates(ReplayLog.from_events(history.records(0, len(history))), PARAMS)
+    for name in GATE_FLAGS:
+        assert np.array_equal(result[name], again[name])
+    assert first_open_frames(result) == first_open_frames(again)
+
+
+@pytest.mark.parametrize("seed", range(4))
+@pytest.mark.parametrize("max_points,grid_size", [(400, 32), (37, 32), (10, 8)])
+def test_coherence_series_matches_coherence_gate(seed, max_points, grid_size):
+    rng = np.random.default_rng(seed)
+    n = 600
+    # clustered points plus some off the grid
+    pts = rng.integers(-3, grid_size + 3, size=(n, 2))
+    clustered = rng.random(n) < 0.5
+    pts[clustered] = rng.integers(0, 4, size=(int(clustered.sum()), 2))
+
+    series = coherence_series(pts, max_points=max_points, grid_size=grid_size)
+    assert len(series) == n
+    for t in rng.choice(n, size=80, replace=False):
+        window = [tuple(p) for p in pts[max(0, t + 1 - max_points):t + 1]]
+        assert series[t] == pytest.approx(coherence_gate(window, grid_size=grid_size), abs=1e-9)
+
+
+def test_empty_log_replays_to_no_frames():
+    result = replay_gates(ReplayLog.from_events([]), PARAMS)
+    assert result["frames"].shape == (0,)
+    assert first_open_frames(result) == [{flag: None for flag in GATE_FLAGS}] * len(PARAMS)
@@ -0,0 +1,79 @@
+import json
+import os
+import random
+
+import pytest
+
+from world_core.ledger import Ledger, LedgerEvent
+from world_core.ledger_segments import INDEX_FILE, SegmentReader, SegmentWriter
+
+KINDS = [
+    ("walker", "walker_interaction"),
+    ("scout:sound", "sound_peaks"),
+    ("scout:light", "light_peaks"),
+    ("surveyor", "surface_points"),
+    ("other", "sound_peaks"),
+]
+
+
+def _write_log(root, seed, runs=3):
+    # several runs into one dir (resume) with small segments and flushes
+    rng = random.Random(seed)
+    events = []
+    for _ in range(runs):
+        writer = SegmentWriter(root, segment_events=700, flush_every=97)
+        for frame in range(1, 800):
+            for _ in range(rng.randint(0, 3)):
+                source, kind = rng.choice(KINDS)
+                writer.append(frame, source, kind, [(1, 2)], None)
+                events.append((frame, source, kind))
+        writer.flush()
+    return events
+
+
+@pytest.mark.parametrize("seed", [1, 2])
+def test_select_matches_brute_force(tmp_path, seed):
+    events = _write_log(str(tmp_path), seed)
+    reader = SegmentReader(str(tmp_path))
+    assert len(reader) == len(events)
+    assert len(reader.segments) > 3
+
+    for kind in (None, "sound_peaks", "walker_interaction", "missing"):
+        for source in (None, "other", "scout:sound", "walker"):
+            for frames in (None, (100, 300), (0, 5), (799, 900)):
+                got = reader.select(kind=kind, source=source, frames=frames)
+                expected = [
+                    i for i, (f, s, k) in enumerate(events)
+                    if (kind is None or k == kind)
+                    and (source is None or s == source)
+                    and (frames is None or frames[0] <= f <= frames[1])
+                ]
+                assert got.tolist() == expected
+
+
+def test_reader_rejects_other_formats(tmp_path):
+    _write_log(str(tmp_path), 0, runs=1)
+    path = os.path.join(str(tmp_path), INDEX_FILE)
+    with open(path) as f:
+        index = json.load(f)
+    index["format"] = 1
+    with open(path, "w") as f:
+        json.dump(index, f)
+    with pytest.raises(ValueError):
+        SegmentReader(str(tmp_path))
+    with pytest.raises(ValueError):
+        SegmentWriter(str(tmp_path))
+
+
+def test_segment_writer_resumes_existing_log(tmp_path):
+    out = str(tmp_path / "log")
+    for run_id in range(2):
+        ledger = Ledger(spill_dir=out)
+        for frame in range(1, 11):
+            ledger.ingest(LedgerEvent(frame, f"run{run_id}", "sound_peaks", {"points_xy": [(frame, run_id)]}))
+        ledger.flush()
+
+    reader = SegmentReader(out)
+    assert len(reader) == 20
+    assert [r["source"] for r in reader.records(0, 20)] == ["run0"] * 10 + ["run1"] * 10
+    assert [r["payload"]["points_xy"] for r in reader.records(10, 12)] == [[(1, 1)], [(2, 1)]]
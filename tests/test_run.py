@@ -0,0 +1,25 @@
+import json
+import os
+
+import pytest
+
+from world_core.ledger_segments import SegmentReader
+from world_core.run import RESULT_FILE, run
+
+
+def test_run_twice_into_same_dir_is_rejected(tmp_path):
+    out = str(tmp_path / "run")
+    first = run(frames=20, seed=1, out_dir=out)
+    reader = SegmentReader(out)
+    n_events = len(reader)
+    records = reader.records(0, n_events)
+
+    with pytest.raises(FileExistsError):
+        run(frames=20, seed=2, out_dir=out)
+
+    # the first run's log and results are untouched
+    reader = SegmentReader(out)
+    assert len(reader) == n_events
+    assert reader.records(0, n_events) == records
+    with open(os.path.join(out, RESULT_FILE)) as f:
+        assert json.load(f)["frames"] == first["frames"] == 20
@@ -0,0 +1,46 @@
+import random
+
+import pytest
+
+from world_core.sandys_square import CoherenceTracker, coherence_gate
+
+
+def _random_points(rng, n, grid_size):
+    pts = []
+    for _ in range(n):
+        r = rng.random()
+        if r < 0.1:
+            # off the grid, including fractional values just outside it
+            pts.append(rng.choice([(-0.5, 3), (3, -0.5), (grid_size, 1), (1, grid_size + 0.25), (-7, 40)]))
+        elif r < 0.2:
+            pts.append((rng.uniform(0, grid_size - 0.01), rng.uniform(0, grid_size - 0.01)))
+        else:
+            cx, cy = rng.randrange(grid_size), rng.randrange(grid_size)
+            pts.append((cx, min(grid_size - 1, cy + rng.randint(0, 2))))
+    return pts
+
+
+@pytest.mark.parametrize("seed", range(5))
+@pytest.mark.parametrize("max_points,grid_size", [(50, 32), (400, 32), (17, 8)])
+def test_tracker_matches_coherence_gate_on_window(seed, max_points, grid_size):
+    rng = random.Random(seed)
+    tracker = CoherenceTracker(max_points=max_points, grid_size=grid_size)
+    history = []
+    for _ in range(60):
+        # mostly small batches, sometimes more than the whole window at once
+        n = rng.choice([0, 1, 3, 10, max_points - 1, max_points, max_points + 7, 3 * max_points])
+        batch = _random_points(rng, n, grid_size)
+        if len(batch) == 1 and rng.random() < 0.5:
+            tracker.add(*batch[0])
+        else:
+            tracker.extend(batch)
+        history.extend(batch)
+        expected = coherence_gate(history[-max_points:], grid_size=grid_size)
+        assert tracker.coherence() == pytest.approx(expected, abs=1e-9)
+
+
+def test_tracker_rejects_negative_fractions():
+    tracker = CoherenceTracker(max_points=10, grid_size=4)
+    tracker.extend([(-0.5, 1), (1, -0.5)])
+    assert tracker.total == 0
+    assert tracker.coherence() == coherence_gate([(-0.5, 1), (1, -0.5)], grid_size=4) == 0.0
@@ -1,5 +1,11 @@
+import time
+
 from world_core.world_space import WorldSpace
 from world_core.world_grid import WorldGrid
+from world_core.field_tiles import FieldTiles
+from world_core.field_engine import sample_points
+from world_core.spatial_index import SpatialIndex
+from world_core.snapshot_bus import SnapshotBus
 
 from world_core.ledger import Ledger
 from world_core.investigator_bot import InvestigatorBot
@@ -30,7 +36,7 @@ class WorldState:
     Everything exists, but downstream layers are GATED.
     """
 
-    def __init__(self, clock):
+    def __init__(self, clock, ledger_dir=None):
         self.clock = clock
         self.frame = 0
 
@@ -38,6 +44,20 @@ class WorldState:
         self.grid = WorldGrid()
         self.places = {}
 
+        # typed registries (kept in sync by add_place / add_room / add_object)
+        self.rooms = {}
+        self.rooms_by_type = {}
+        self.objects = {}
+        self.emitters = {"sound": [], "light": []}
+        self.interactives = []
+
+        # spatial indexes over bounds (point-location / box-overlap queries)
+        self.place_index = SpatialIndex(cell_m=50.0)
+        self.room_index = SpatialIndex(cell_m=10.0)
+
+        # bumped whenever places/rooms/bounds change (geometry caches key on it)
+        self.geometry_version = 0
+
         # profiles (held behind manager approvals)
         self.people = []
         self.animals = []
@@ -48,7 +68,7 @@ class WorldState:
         self.surveyor = None
 
         # pipeline
-        self.ledger = Ledger()
+        self.ledger = Ledger(spill_dir=ledger_dir)
         self.investigator = InvestigatorBot()
 
         self.manager = ManagerBot()
@@ -58,12 +78,90 @@ class WorldState:
         self.architect = ArchitectBot()
         self.builder = BuilderBot()
 
+        # per-frame snapshot record (producers publish once, everyone reads it)
+        self.snapshot_bus = SnapshotBus()
+
         # latest grids for UI
         self._latest_sensor_grids = {"sound": None, "light": None}
 
+        # neighbourhood-wide tiled fields (built lazily on first view/query,
+        # refit when the geometry changes)
+        self._field_tiles = {}
+        self._field_tiles_version = None
+
+        # optional per-phase tick timing: {phase: seconds}, None = off
+        self.phase_times = None
+
     def add_place(self, place):
         self.places[place.name] = place
         self.grid.register(place)
+        self.place_index.insert(place)
+        for room in getattr(place, "rooms", {}).values():
+            self._index_room(room)
+        self.geometry_version += 1
+
+    def add_room(self, place, room):
+        # builder mutation: attach a room to an existing place
+        place.rooms[room.name] = room
+        self._index_room(room)
+        self.geometry_version += 1
+
+    def add_object(self, room, key, obj):
+        # builder mutation: place an object into an existing room
+        room.objects[key] = obj
+        self._index_object(room, key, obj)
+
+    def set_object_bounds(self, obj, min_xyz, max_xyz):
+        # builder mutation: resize/move a place or room and keep the indexes in sync
+        obj.set_bounds(min_xyz, max_xyz)
+        for index in (self.place_index, self.room_index):
+            if obj in index:
+                index.update(obj)
+        self.grid.mark_moved(obj)
+        self.geometry_version += 1
+
+    def places_at(self, xyz):
+        return self.place_index.query_point(xyz)
+
+    def rooms_at(self, xyz):
+        return self.room_index.query_point(xyz)
+
+    def solids_in_box(self, min_xyz, max_xyz):
+        # places + rooms whose bounds overlap the box
+        return self.place_index.query_box(min_xyz, max_xyz) + self.room_index.query_box(min_xyz, max_xyz)
+
+    def is_occupied(self, xyz) -> bool:
+        return self.place_index.any_at(xyz) or self.room_index.any_at(xyz)
+
+    def _index_room(self, room):
+        self.rooms[room.name] = room
+        self.room_index.insert(room)
+        self.rooms_by_type.setdefault(getattr(room, "room_type", ""), []).append(room)
+        for key, obj in getattr(room, "objects", {}).items():
+            self._index_object(room, key, obj)
+
+    def _index_object(self, room, key, obj):
+        self.objects[f"{room.name}:{key}"] = obj
+        if hasattr(obj, "sound_level_at"):
+            self.emitters["sound"].append(obj)
+        if hasattr(obj, "light_level_at"):
+            self.emitters["light"].append(obj)
+        if hasattr(obj, "power_toggle") or hasattr(obj, "press_power"):
+            self.interactives.append((room, key, obj))
+
+    def emitters_of(self, mode: str):
+        return self.emitters.get(mode, [])
+
+    def levels_at(self, mode: str, points):
+        """
+        Field level of `mode` at each (x, y, z) in points, one batched pass
+        over the registered emitters (same model as the scout grids).
+        Returns an (N,) array.
+        """
+        return sample_points(points, [(obj.position, obj.emitter(mode).level()) for obj in self.emitters_of(mode)])
+
+    def rooms_of_type(self, room_type: str):
+        return self.rooms_by_type.get(room_type, [])
 
     def add_agent(self, agent):
         self.agents.append(agent)
@@ -74,13 +172,51 @@ class WorldState:
     def set_surveyor(self, surveyor):
         self.surveyor = surveyor
 
+    def field_tiles(self, mode: str):
+        """
+        Tiled multi-resolution field covering every place (square, xy only).
+        """
+        if self._field_tiles_version != self.geometry_version:
+            self._field_tiles = {}
+            self._field_tiles_version = self.geometry_version
+        tiles = self._field_tiles.get(mode)
+        if tiles is None:
+            boxes = [p.bounds for p in self.places.values() if getattr(p, "bounds", None)]
+            if not boxes:
+                return None
+            min_x = min(b[0][0] for b in boxes)
+            min_y = min(b[0][1] for b in boxes)
+            max_x = max(b[1][0] for b in boxes)
+            max_y = max(b[1][1] for b in boxes)
+            tiles = FieldTiles(mode=mode, origin_xy=(min_x, min_y), size_m=max(max_x - min_x, max_y - min_y, 1.0))
+            self._field_tiles[mode] = tiles
+        return tiles
+
     def get_latest_sensor_grid(self, mode: str):
         return self._latest_sensor_grids.get(mode)
 
+    def enable_phase_timing(self, on: bool = True):
+        # accumulate wall time per tick phase into self.phase_times
+        self.phase_times = {} if on else None
+
+    def _lap(self, phase, t0):
+        # add time since t0 to `phase`; returns the new mark (None when timing is off)
+        if t0 is None:
+            return None
+        now = time.perf_counter()
+        self.phase_times[phase] = self.phase_times.get(phase, 0.0) + (now - t0)
+        return now
+
     def tick(self):
+        t = time.perf_counter() if self.phase_times is not None else None
+
         # frame + world space
         self.frame += 1
         self.space.tick(self.frame)
+        t = self._lap("space", t)
+
+        bus = self.snapshot_bus
+        record = bus.begin(self.frame)
 
         # 1) physics + perception
         for a in self.agents:
@@ -88,49 +224,50 @@ class WorldState:
                 a.tick(self.clock)
             if hasattr(a, "observe"):
                 a.observe(self)
+        t = self._lap("agents", t)
 
         for s in self.scouts:
             s.observe(self)
-            # cache for UI (grid is numpy array)
-            snap = s.snapshot()
-            if snap.get("mode") in self._latest_sensor_grids and "grid" in snap:
-                self._latest_sensor_grids[snap["mode"]] = snap["grid"]
+        t = self._lap("scouts", t)
 
         if self.surveyor:
             self.surveyor.observe(self)
+        t = self._lap("surveyor", t)
 
-        # 2) snapshots -> investigator -> ledger events
-        snaps = []
+        # 2) one snapshot pass -> bus -> investigator -> ledger events
         for a in self.agents:
             if hasattr(a, "snapshot"):
-                snaps.append(a.snapshot())
+                bus.publish(a, a.snapshot())
 
         for s in self.scouts:
-            snaps.append(s.snapshot())
+            bus.publish(s, *s.channel_snapshots())
 
         if self.surveyor and hasattr(self.surveyor, "snapshot"):
-            snaps.append(self.surveyor.snapshot())
+            bus.publish(self.surveyor, self.surveyor.snapshot())
+
+        # cache for UI (read-only grid views, one per channel)
+        for mode, grid in record.grids.items():
+            if mode in self._latest_sensor_grids:
+                self._latest_sensor_grids[mode] = grid
+        t = self._lap("snapshots", t)
 
-        for snap in snaps:
-            events = self.investigator.ingest_snapshot(self.frame, snap)
-            for ev in events:
-                self.ledger.ingest(ev)
+        self.ledger.ingest_many(self.investigator.ingest_snapshots(self.frame, record.snapshots))
+        t = self._lap("ingest", t)
 
         # 3) recompute Sandy gates (authoritative)
         self.ledger.recompute_gates()
+        t = self._lap("gates", t)
 
         gates = self.ledger.gates_snapshot()
         mgr = self.manager
 
         # 4) downstream layers (exist, but dormant until gates + approvals)
         if gates["object_stable"]:
-            self.concierge.propose(self.ledger.tail(200))
+            self.concierge.propose_counts(self.ledger.window_counts())
 
         if gates["symbol_ready"]:
-            lang_events = self.language.ingest_proposals(self.concierge.proposals_tail())
-            for le in lang_events:
-                for ev in self.investigator.ingest_snapshot(self.frame, le):
-                    self.ledger.ingest(ev)
+            lang_events = bus.publish(self.language, *self.language.ingest_proposals(self.concierge.proposals_tail()))
+            self.ledger.ingest_many(self.investigator.ingest_snapshots(self.frame, lang_events))
             self.ledger.recompute_gates()
 
         if mgr.approved("neighbourhood"):
@@ -148,9 +285,12 @@ class WorldState:
         if mgr.approved("builder") and mgr.approved("architect"):
             self.builder.execute(self.architect.plans_tail(), world=self)
 
+        bus.end()
+        self._lap("downstream", t)
+
 
-def build_world(clock):
-    world = WorldState(clock)
+def build_world(clock, ledger_dir=None):
+    world = WorldState(clock, ledger_dir=ledger_dir)
 
     # ------------------------------------------------
     # Places (always exist)
@@ -196,8 +336,8 @@ def build_world(clock):
     # ------------------------------------------------
     # Scouts (always active)
     # ------------------------------------------------
-    world.add_scout(ScoutBot(name="Scout-Sound", mode="sound", center_xyz=house_a.position, extent_m=40, resolution_m=2.0))
-    world.add_scout(ScoutBot(name="Scout-Light", mode="light", center_xyz=house_a.position, extent_m=40, resolution_m=2.0))
+    # one multi-channel scout: sound + light in a single pass (Scout-Sound / Scout-Light per channel)
+    world.add_scout(ScoutBot(name="Scout", mode="multi", channels=("sound", "light"), center_xyz=house_a.position, extent_m=40, resolution_m=2.0))
 
     # ------------------------------------------------
     # Surveyor (always active)
@@ -5,5 +5,7 @@ class BuilderBot:
     """
     def execute(self, plans, world=None):
         # In stage-1, builder does not mutate the world.
-        # Later, it can place bricks/walls etc.
+        # Later, it can place bricks/walls etc. Mutations must go through
+        # world.add_place / add_room / add_object / set_object_bounds so the
+        # registries, spatial indexes and geometry_version stay in sync.
         return
\ No newline at end of file
@@ -8,10 +8,18 @@ class ConciergeBot:
 
     def propose(self, ledger_tail):
         # ledger_tail is list[dict]
+        counts = {}
+        for e in ledger_tail:
+            k = e.get("kind")
+            counts[k] = counts.get(k, 0) + 1
+        self.propose_counts(counts)
+
+    def propose_counts(self, kind_counts):
+        # kind_counts: {kind: events in the recent window} (Ledger.window_counts)
         # naive: if we see repeated walker interactions + peaks, propose "object_candidate"
-        w = sum(1 for e in ledger_tail if e.get("kind") == "walker_interaction")
-        s = sum(1 for e in ledger_tail if e.get("kind") == "sound_peaks")
-        l = sum(1 for e in ledger_tail if e.get("kind") == "light_peaks")
+        w = kind_counts.get("walker_interaction", 0)
+        s = kind_counts.get("sound_peaks", 0)
+        l = kind_counts.get("light_peaks", 0)
 
         if w >= 3 and (s + l) >= 5:
             self._proposals.append({
@@ -0,0 +1,116 @@
+# world_core/delta_snapshot.py
+#
+# Delta snapshot protocol:
+#   - every snapshot carries its header (source, name) and "keyframe": bool
+#   - a keyframe holds every field; a delta only the fields that changed
+#     (dict-valued fields are diffed one level down)
+#   - transient fields are sent whenever non-empty and never carried over
+#   - between keyframes a producer may leave out fields (or dict sub-keys) it
+#     knows are unchanged; absent fields keep their last sent value
+
+HEADER = ("source", "name")
+TRANSIENT = ("last_interaction", "points_xy")
+
+_MISSING = object()
+
+
+def _same(a, b):
+    if a is b:
+        return True
+    try:
+        return bool(a == b)
+    except Exception:
+        return False
+
+
+class DeltaEncoder:
+    """
+    Producer side: full field dict in, delta (or periodic keyframe) out.
+    Values are kept by reference for the next comparison, so producers
+    hand over fresh objects instead of mutating sent ones in place.
+    """
+
+    def __init__(self, keyframe_every: int = 100, transient=TRANSIENT):
+        self.keyframe_every = int(keyframe_every)
+        self.transient = tuple(transient)
+        self._sent = {}
+        self._since_keyframe = None  # None: next snapshot is a keyframe
+
+    def reset(self):
+        # force a keyframe next time
+        self._since_keyframe = None
+
+    @property
+    def keyframe_due(self) -> bool:
+        # the next encode() is a keyframe: producers must hand over every field
+        return self._since_keyframe is None or self._since_keyframe >= self.keyframe_every
+
+    def encode(self, fields: dict) -> dict:
+        keyframe = self.keyframe_due
+        out = {k: fields[k] for k in HEADER if k in fields}
+        out["keyframe"] = keyframe
+
+        for k, v in fields.items():
+            if k in HEADER:
+                continue
+            if k in self.transient:
+                if v:
+                    out[k] = v
+                continue
+            prev = self._sent.get(k, _MISSING)
+            if keyframe or prev is _MISSING:
+                out[k] = v
+            elif isinstance(v, dict) and isinstance(prev, dict):
+                changed = {sk: sv for sk, sv in v.items() if not _same(prev.get(sk, _MISSING), sv)}
+                if changed:
+                    out[k] = changed
+                    # mirror the consumer's merge (v may hold only some sub-keys)
+                    v = {**prev, **changed}
+                else:
+                    v = prev
+            elif not _same(prev, v):
+                out[k] = v
+            self._sent[k] = v
+
+        # fields (or sub-keys) that disappeared are only dropped by the next keyframe
+        self._since_keyframe = 0 if keyframe else self._since_keyframe + 1
+        return out
+
+
+class DeltaState:
+    """
+    Consumer side: per-producer state merged from keyframes + deltas.
+    """
+
+    def __init__(self, transient=TRANSIENT):
+        self.transient = tuple(transient)
+        self.states = {}  # (source, name) -> merged fields (no transients)
+
+    def apply(self, snap: dict) -> dict:
+        """
+        Merge one snapshot; returns the producer's full view for this frame
+        (merged state + this snapshot's transient fields).
+        """
+        if "keyframe" not in snap:
+            return snap  # not a delta producer
+        key = (snap.get("source"), snap.get("name"))
+        state = self.states.get(key)
+        if state is None or snap["keyframe"]:
+            state = self.states[key] = {}
+
+        for k, v in snap.items():
+            if k in self.transient or k == "keyframe":
+                continue
+            prev = state.get(k)
+            if not snap["keyframe"] and isinstance(v, dict) and isinstance(prev, dict):
+                merged = dict(prev)
+                merged.update(v)
+                state[k] = merged
+            else:
+                state[k] = v
+
+        view = dict(state)
+        for k in self.transient:
+            if k in snap:
+                view[k] = snap[k]
+        return view
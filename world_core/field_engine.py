@@ -0,0 +1,144 @@
+# world_core/field_engine.py
+
+import numpy as np
+
+
+def grid_axes(center_xyz, extent_m: float, resolution_m: float):
+    """
+    Sample axes for a square sensor grid around center_xyz.
+    Same layout the scouts/surveyor use: n cells per side (clamped 8..128),
+    first sample at center - extent.
+    Returns (n, xs, ys).
+    """
+    cx, cy, _ = center_xyz
+    r = float(extent_m)
+    step = float(resolution_m)
+
+    n = int((2*r) / step)
+    n = max(8, min(128, n))
+
+    steps = np.arange(n, dtype=float) * step
+    xs = (cx - r) + steps
+    ys = (cy - r) + steps
+    return n, xs, ys
+
+
+def falloff(xs: np.ndarray, ys: np.ndarray, z: float, origin_xyz, base: float = 1.0) -> np.ndarray:
+    """
+    Inverse-square falloff of one emitter over the (ys, xs) grid.
+    Matches TVProfile._attenuate per point: base inside 1m, base / d^2 outside.
+    """
+    ox, oy, oz = origin_xyz
+    dx = xs[None, :] - ox
+    dy = ys[:, None] - oy
+    dz = float(z) - oz
+    d = np.sqrt(dx*dx + dy*dy + dz*dz)
+    return _inverse_square(d, base)
+
+
+def point_falloff(points: np.ndarray, origin_xyz, base: float = 1.0) -> np.ndarray:
+    """
+    Same falloff as `falloff`, for an (N, 3) array of arbitrary points.
+    """
+    d = np.sqrt(np.sum((points - np.asarray(origin_xyz, dtype=float)) ** 2, axis=1))
+    return _inverse_square(d, base)
+
+
+def _inverse_square(d: np.ndarray, base: float) -> np.ndarray:
+    # near-field clamp: full level inside 1m (no division by d == 0)
+    return base / np.maximum(d*d, 1.0)
+
+
+def as_points(points) -> np.ndarray:
+    """
+    Coerce [(x, y, z), ...] (or an (N, 3) array) to a float (N, 3) array.
+    """
+    pts = np.asarray(points, dtype=float)
+    return pts.reshape(-1, 3)
+
+
+def source_level(src) -> float:
+    # SoundField sources expose get_level(); SoundSource/LightSource expose level()
+    if hasattr(src, "get_level"):
+        return float(src.get_level())
+    return float(src.level())
+
+
+def sample_sources(points, sources, floor: float = 0.02) -> np.ndarray:
+    """
+    Batched SoundField.sample: every source over every point.
+    Attenuation is clamped to 1.0 inside 1m and floored at `floor`;
+    totals are capped at 1.0 and rounded to 3 dp like the scalar path.
+    """
+    pts = as_points(points)
+    total = np.zeros(len(pts), dtype=float)
+    for src in sources:
+        level = source_level(src)
+        if level <= 0:
+            continue
+        attenuation = np.maximum(point_falloff(pts, src.position), floor)
+        total += level * attenuation
+    return np.round(np.minimum(total, 1.0), 3)
+
+
+def emitter_field(xs: np.ndarray, ys: np.ndarray, z: float, origin_xyz, level: float) -> np.ndarray:
+    """
+    One emitter's capped contribution (same as *_level_at, per cell).
+    """
+    return np.minimum(1.0, falloff(xs, ys, z, origin_xyz, base=float(level)))
+
+
+def falloff_kernel(xs: np.ndarray, ys: np.ndarray, z: float, origin_xyz) -> np.ndarray:
+    """
+    Unit-level falloff for a fixed (grid, emitter position) pair.
+    Precompute once; apply_kernel turns it into a contribution per frame.
+    """
+    return falloff(xs, ys, z, origin_xyz, base=1.0)
+
+
+def apply_kernel(kernel: np.ndarray, level: float) -> np.ndarray:
+    """
+    Capped contribution of an emitter at `level` from its precomputed kernel.
+    """
+    return np.minimum(1.0, float(level) * kernel)
+
+
+def sample_grid(xs: np.ndarray, ys: np.ndarray, z: float, emitters) -> np.ndarray:
+    """
+    Sum every emitter over the whole grid, capped at 1.0.
+    emitters: iterable of (origin_xyz, level).
+    """
+    total = np.zeros((len(ys), len(xs)), dtype=float)
+    for origin, level in emitters:
+        total += emitter_field(xs, ys, z, origin, level)
+    return np.minimum(1.0, total)
+
+
+def sample_points(points, emitters) -> np.ndarray:
+    """
+    sample_grid at arbitrary points: each emitter capped at 1.0 (as
+    *_level_at), summed, capped again. emitters: iterable of (origin_xyz, level).
+    """
+    pts = as_points(points)
+    total = np.zeros(len(pts), dtype=float)
+    for origin, level in emitters:
+        total += np.minimum(1.0, point_falloff(pts, origin, base=float(level)))
+    return np.minimum(1.0, total)
+
+
+def peak_points(grid: np.ndarray, k: int = 12, threshold: float = 0.25, size: int = 32):
+    """
+    Top-k cells above threshold, mapped onto a size x size SandySquare.
+    """
+    flat = grid.ravel()
+    if flat.size == 0:
+        return []
+    n_y, n_x = grid.shape
+    k = min(k, flat.size)
+    idx = np.argpartition(flat, -k)[-k:]
+    idx = idx[flat[idx] >= threshold]
+    iy = idx // n_x
+    ix = idx % n_x
+    gx = ((ix / max(1, n_x-1)) * (size-1)).astype(int)
+    gy = ((iy / max(1, n_y-1)) * (size-1)).astype(int)
+    return [(int(x), int(y)) for x, y in zip(gx, gy)]
@@ -0,0 +1,240 @@
+# world_core/field_tiles.py
+
+from collections import OrderedDict
+import math
+
+import numpy as np
+
+from world_core.field_engine import falloff_kernel, apply_kernel
+
+
+class FieldTiles:
+    """
+    Tiled multi-resolution sensor field (quadtree of fixed-size tiles).
+
+    - Root tile covers the whole square region; level L splits it 2^L x 2^L.
+    - Every tile is tile_cells x tile_cells, so finer levels = finer cells.
+    - Tiles are refined near active emitters and stay coarse elsewhere.
+    - Tiles are only computed when viewed/queried, and kept in a bounded
+      LRU cache keyed on the state of the emitters that reach them.
+    - An emitter reaches a tile while its level / d^2 stays >= min_level;
+      anything fainter is left out of the tile (and out of its key).
+    """
+
+    def __init__(
+        self,
+        mode: str,
+        origin_xy,
+        size_m: float,
+        z: float = 0.0,
+        tile_cells: int = 32,
+        max_level: int = 6,
+        fine_radius_m: float = 40.0,
+        max_tiles: int = 512,
+        min_level: float = 1e-3,
+    ):
+        self.mode = mode
+        self.origin_xy = (float(origin_xy[0]), float(origin_xy[1]))
+        self.size_m = float(size_m)
+        self.z = float(z)
+        self.tile_cells = int(tile_cells)
+        self.max_level = int(max_level)
+        self.fine_radius_m = float(fine_radius_m)
+        self.max_tiles = int(max_tiles)
+        self.min_level = float(min_level)
+
+        self._tiles = OrderedDict()  # (level, tx, ty) -> (emitter_state, tile)
+        self.computed = 0            # tiles actually (re)computed
+
+    # ------------------------------------------------
+    # geometry
+    # ------------------------------------------------
+    def tile_size_m(self, level: int) -> float:
+        return self.size_m / (2 ** int(level))
+
+    def cell_size_m(self, level: int) -> float:
+        return self.tile_size_m(level) / self.tile_cells
+
+    def tile_bounds(self, level: int, tx: int, ty: int):
+        ts = self.tile_size_m(level)
+        x0 = self.origin_xy[0] + tx * ts
+        y0 = self.origin_xy[1] + ty * ts
+        return x0, y0, x0 + ts, y0 + ts
+
+    def tile_index(self, level: int, x: float, y: float):
+        ts = self.tile_size_m(level)
+        last = 2 ** int(level) - 1
+        tx = int(math.floor((x - self.origin_xy[0]) / ts))
+        ty = int(math.floor((y - self.origin_xy[1]) / ts))
+        return max(0, min(last, tx)), max(0, min(last, ty))
+
+    def level_for_point(self, x: float, y: float, emitters) -> int:
+        """
+        Finest level inside fine_radius_m of an active emitter; one level
+        coarser every time the distance doubles.
+        """
+        return self._wanted_level(self._nearest_active(emitters, x, y, x, y))
+
+    # ------------------------------------------------
+    # tiles
+    # ------------------------------------------------
+    def tile(self, world, level: int, tx: int, ty: int) -> np.ndarray:
+        """
+        Field values for one tile (tile_cells x tile_cells, sampled at cell centres).
+        """
+        return self._tile(world.emitters_of(self.mode), level, tx, ty)
+
+    def sample(self, world, x: float, y: float) -> float:
+        """
+        Field value at (x, y) from the adaptive tile that covers it.
+        """
+        emitters = world.emitters_of(self.mode)
+        level = self.level_for_point(x, y, emitters)
+        tx, ty = self.tile_index(level, x, y)
+        t = self._tile(emitters, level, tx, ty)
+        x0, y0, _, _ = self.tile_bounds(level, tx, ty)
+        cs = self.cell_size_m(level)
+        last = self.tile_cells - 1
+        ix = max(0, min(last, int((x - x0) / cs)))
+        iy = max(0, min(last, int((y - y0) / cs)))
+        return float(t[iy, ix])
+
+    def leaves_for_view(self, world, view_bounds, target_cell_m: float):
+        """
+        Quadtree leaves covering view_bounds=(x0, y0, x1, y1).
+        A tile splits while its cells are coarser than target_cell_m AND it
+        is close enough to an active emitter to want a finer level.
+        Returns [(level, tx, ty), ...].
+        """
+        emitters = world.emitters_of(self.mode)
+        vx0, vy0, vx1, vy1 = view_bounds
+        leaves = []
+        stack = [(0, 0, 0)]
+        while stack:
+            level, tx, ty = stack.pop()
+            bx0, by0, bx1, by1 = self.tile_bounds(level, tx, ty)
+            if bx1 <= vx0 or bx0 >= vx1 or by1 <= vy0 or by0 >= vy1:
+                continue
+
+            split = level < self.max_level and self.cell_size_m(level) > target_cell_m
+            if split:
+                # only refine where something is emitting
+                split = level < self._wanted_level(self._nearest_active(emitters, bx0, by0, bx1, by1))
+
+            if split:
+                for cy in (0, 1):
+                    for cx in (0, 1):
+                        stack.append((level + 1, 2*tx + cx, 2*ty + cy))
+            else:
+                leaves.append((level, tx, ty))
+        return leaves
+
+    def render_view(self, world, center_xy=None, zoom: float = 1.0, size: int = 256) -> np.ndarray:
+        """
+        Render a size x size raster of the field for a viewport (centre + zoom).
+        zoom=1 shows the whole region; only tiles in view are computed.
+        """
+        if center_xy is None:
+            center_xy = (self.origin_xy[0] + self.size_m/2, self.origin_xy[1] + self.size_m/2)
+        span = self.size_m / max(1e-6, float(zoom))
+        vx0 = float(center_xy[0]) - span/2
+        vy0 = float(center_xy[1]) - span/2
+        px = span / size
+
+        out = np.zeros((size, size), dtype=float)
+        centers = (np.arange(size) + 0.5) * px
+        pxs = vx0 + centers
+        pys = vy0 + centers
+
+        emitters = world.emitters_of(self.mode)
+        for level, tx, ty in self.leaves_for_view(world, (vx0, vy0, vx0 + span, vy0 + span), px):
+            bx0, by0, bx1, by1 = self.tile_bounds(level, tx, ty)
+            ix0, ix1 = np.searchsorted(pxs, [bx0, bx1])
+            iy0, iy1 = np.searchsorted(pys, [by0, by1])
+            if ix0 >= ix1 or iy0 >= iy1:
+                continue
+            t = self._tile(emitters, level, tx, ty)
+            cs = self.cell_size_m(level)
+            last = self.tile_cells - 1
+            cx = np.clip(((pxs[ix0:ix1] - bx0) / cs).astype(int), 0, last)
+            cy = np.clip(((pys[iy0:iy1] - by0) / cs).astype(int), 0, last)
+            out[iy0:iy1, ix0:ix1] = t[np.ix_(cy, cx)]
+        return out
+
+    def snapshot(self):
+        return {
+            "mode": self.mode,
+            "origin_xy": self.origin_xy,
+            "size_m": self.size_m,
+            "tile_cells": self.tile_cells,
+            "max_level": self.max_level,
+            "cached_tiles": len(self._tiles),
+            "computed_tiles": self.computed,
+        }
+
+    # ------------------------------------------------
+    # internals
+    # ------------------------------------------------
+    def _tile(self, emitters, level, tx, ty):
+        x0, y0, x1, y1 = self.tile_bounds(level, tx, ty)
+        reaching = self._reaching(emitters, x0, y0, x1, y1)
+        state = tuple((id(obj), src.version, pos) for obj, src, pos, _ in reaching)
+        key = (int(level), int(tx), int(ty))
+        cached = self._tiles.get(key)
+        if cached is not None and cached[0] == state:
+            self._tiles.move_to_end(key)
+            return cached[1]
+
+        cs = self.cell_size_m(level)
+        centers = (np.arange(self.tile_cells) + 0.5) * cs
+        xs = x0 + centers
+        ys = y0 + centers
+
+        total = np.zeros((self.tile_cells, self.tile_cells), dtype=float)
+        for _, _, pos, level_now in reaching:
+            total += apply_kernel(falloff_kernel(xs, ys, self.z, pos), level_now)
+        t = np.minimum(1.0, total).astype(np.float32)
+
+        self._tiles[key] = (state, t)
+        self._tiles.move_to_end(key)
+        while len(self._tiles) > self.max_tiles:
+            self._tiles.popitem(last=False)
+        self.computed += 1
+        return t
+
+    def _reaching(self, emitters, x0, y0, x1, y1):
+        # [(obj, source, position, level), ...] for emitters that reach the box
+        out = []
+        for obj in emitters:
+            src = obj.emitter(self.mode)
+            level = src.level()
+            if level < self.min_level:
+                continue
+            pos = tuple(obj.position)
+            dx = max(x0 - pos[0], 0.0, pos[0] - x1)
+            dy = max(y0 - pos[1], 0.0, pos[1] - y1)
+            dz = self.z - pos[2]
+            # level / d^2 >= min_level  <=>  d^2 <= level / min_level
+            if dx*dx + dy*dy + dz*dz <= level / self.min_level:
+                out.append((obj, src, pos, level))
+        return out
+
+    def _wanted_level(self, d: float) -> int:
+        if d <= self.fine_radius_m:
+            return self.max_level
+        if math.isinf(d):
+            return 0
+        drop = int(math.ceil(math.log2(d / self.fine_radius_m)))
+        return max(0, self.max_level - drop)
+
+    def _nearest_active(self, emitters, x0, y0, x1, y1) -> float:
+        # distance from box (x0, y0, x1, y1) to the closest emitting source
+        best = math.inf
+        for obj in emitters:
+            if obj.emitter(self.mode).level() <= 0:
+                continue
+            ex, ey = obj.position[0], obj.position[1]
+            dx = max(x0 - ex, 0.0, ex - x1)
+            dy = max(y0 - ey, 0.0, ey - y1)
+            best = min(best, math.hypot(dx, dy))
+        return best
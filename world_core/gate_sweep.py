@@ -0,0 +1,108 @@
+# world_core/gate_sweep.py
+#
+# Sweep Sandy gate parameters over a recorded ledger (SegmentWriter dir):
+#   python -m world_core.gate_sweep ledger_runs/<run> \
+#       --grid symbol_threshold=0.5,0.6,0.7 --grid window=100,200 --out sweep.json
+
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, fields, replace
+import itertools
+import json
+import os
+
+from world_core.ledger_gates import GateParams
+from world_core.ledger_replay import ReplayLog, replay_gates, first_open_frames
+
+_FIELD_TYPES = {f.name: f.type for f in fields(GateParams)}
+
+_worker_log = None  # ReplayLog, loaded once per worker process
+
+
+def param_grid(base: GateParams = None, **axes):
+    """
+    Every GateParams in the cartesian product of axes (field -> values).
+    """
+    base = base or GateParams()
+    for name in axes:
+        if name not in _FIELD_TYPES:
+            raise ValueError(f"unknown gate parameter: {name}")
+    names = list(axes)
+    return [replace(base, **dict(zip(names, combo))) for combo in itertools.product(*(axes[n] for n in names))]
+
+
+def _batches(params, batch_size):
+    # keep configs that share a coherence series together, so each batch
+    # computes it once (see replay_gates)
+    ordered = sorted(params, key=lambda p: (p.max_points, p.grid_size, p.window))
+    for i in range(0, len(ordered), batch_size):
+        yield ordered[i:i + batch_size]
+
+
+def _init_worker(log_dir):
+    global _worker_log
+    _worker_log = ReplayLog.from_segments(log_dir)
+
+
+def _run_batch(params):
+    rows = first_open_frames(replay_gates(_worker_log, params))
+    return [{"params": asdict(p), "first_open": row} for p, row in zip(params, rows)]
+
+
+def sweep(log_dir, params, workers: int = None, batch_size: int = 8):
+    """
+    First-open frame of every gate for each parameter set, in input order.
+    Batches run independently in a process pool; each worker memory-maps
+    the log once.
+    """
+    params = list(params)
+    if not params:
+        return []
+    workers = workers or os.cpu_count() or 1
+    # enough batches to keep every worker busy
+    batch_size = max(1, min(int(batch_size), -(-len(params) // workers)))
+
+    batches = list(_batches(params, batch_size))
+    if workers == 1:
+        _init_worker(log_dir)
+        outputs = [_run_batch(b) for b in batches]
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(str(log_dir),)) as pool:
+            outputs = list(pool.map(_run_batch, batches))
+
+    results = {}
+    for batch, out in zip(batches, outputs):
+        results.update(zip(batch, out))
+    return [results[p] for p in params]
+
+
+def _parse_axis(spec):
+    name, _, values = spec.partition("=")
+    name = name.strip()
+    if name not in _FIELD_TYPES:
+        raise argparse.ArgumentTypeError(f"unknown gate parameter: {name}")
+    cast = int if _FIELD_TYPES[name] in (int, "int") else float
+    return name, [cast(v) for v in values.split(",") if v.strip()]
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Sweep Sandy gate parameters over a recorded ledger.")
+    ap.add_argument("log_dir", help="ledger segment directory (e.g. ledger_runs/<run>)")
+    ap.add_argument("--grid", action="append", type=_parse_axis, default=[],
+                    metavar="FIELD=V1,V2,...", help="GateParams field and values (repeatable)")
+    ap.add_argument("--workers", type=int, default=None)
+    ap.add_argument("--batch-size", type=int, default=8)
+    ap.add_argument("--out", default=None, help="write results as JSON here (default: stdout)")
+    args = ap.parse_args(argv)
+
+    rows = sweep(args.log_dir, param_grid(**dict(args.grid)), workers=args.workers, batch_size=args.batch_size)
+    text = json.dumps(rows, indent=2)
+    if args.out:
+        with open(args.out, "w") as f:
+            f.write(text)
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,11 @@
 from world_core.ledger import LedgerEvent
+from world_core.delta_snapshot import DeltaState
+
+# scout mode -> (ledger source, ledger kind)
+SCOUT_CHANNELS = {
+    "sound": ("scout:sound", "sound_peaks"),
+    "light": ("scout:light", "light_peaks"),
+}
 
 class InvestigatorBot:
     """
@@ -6,65 +13,91 @@ class InvestigatorBot:
     No semantics. No names. Just numeric evidence.
     """
 
+    def __init__(self):
+        # snapshot "source" -> handler(frame, snap, out)
+        self.handlers = {
+            "walker": self._walker,
+            "scout": self._scout,
+            "surveyor": self._surveyor,
+            "language": self._language,
+        }
+        # merged state of delta-snapshot producers (observer, walkers)
+        self.deltas = DeltaState()
+
     def ingest_snapshot(self, frame: int, snap: dict):
-        out = []
-        if not isinstance(snap, dict):
-            return out
+        return self.ingest_snapshots(frame, (snap,))
 
-        src = snap.get("source", "unknown")
+    def ingest_snapshots(self, frame: int, snaps):
+        """
+        One frame's snapshots -> its ledger events, in snapshot order.
+        """
+        out = []
+        handlers = self.handlers
+        for snap in snaps:
+            if not isinstance(snap, dict):
+                continue
+            snap = self.deltas.apply(snap)
+            handler = handlers.get(snap.get("source", "unknown"))
+            if handler is not None:
+                handler(frame, snap, out)
+        return out
 
-        # Walker interactions
-        if src == "walker":
-            if snap.get("last_interaction"):
-                out.append(LedgerEvent(
-                    frame=frame,
-                    source="walker",
-                    kind="walker_interaction",
-                    payload={
-                        "interaction": snap.get("last_interaction"),
-                        "points_xy": snap.get("points_xy", []),
-                    }
-                ))
+    def producer_states(self):
+        """
+        {(source, name): latest full view} for every delta-snapshot producer.
+        """
+        return {key: dict(state) for key, state in self.deltas.states.items()}
 
-        # Scout peaks
-        if src == "scout" and snap.get("mode") == "sound":
-            pts = snap.get("peak_points_xy", [])
-            if pts:
-                out.append(LedgerEvent(
-                    frame=frame,
-                    source="scout:sound",
-                    kind="sound_peaks",
-                    payload={"points_xy": pts}
-                ))
+    # Walker interactions
+    def _walker(self, frame, snap, out):
+        if snap.get("last_interaction"):
+            out.append(LedgerEvent(
+                frame=frame,
+                source="walker",
+                kind="walker_interaction",
+                payload={
+                    "interaction": snap.get("last_interaction"),
+                    "points_xy": snap.get("points_xy", []),
+                }
+            ))
 
-        if src == "scout" and snap.get("mode") == "light":
-            pts = snap.get("peak_points_xy", [])
-            if pts:
-                out.append(LedgerEvent(
-                    frame=frame,
-                    source="scout:light",
-                    kind="light_peaks",
-                    payload={"points_xy": pts}
-                ))
+    # Scout peaks
+    def _scout(self, frame, snap, out):
+        if snap.get("mode") == "multi":
+            # ScoutBot.snapshot() of a multi-channel scout: same events as its channel_snapshots()
+            peaks = snap.get("peaks_by_channel", {})
+            for ch in snap.get("channels", list(peaks)):
+                self._scout_peaks(frame, ch, peaks.get(ch, []), out)
+            return
+        self._scout_peaks(frame, snap.get("mode"), snap.get("peak_points_xy", []), out)
 
-        # Surveyor surface points
-        if src == "surveyor":
-            pts = snap.get("surface_points_xy", [])
-            if pts:
-                out.append(LedgerEvent(
-                    frame=frame,
-                    source="surveyor",
-                    kind="surface_points",
-                    payload={"points_xy": pts}
-                ))
+    def _scout_peaks(self, frame, mode, pts, out):
+        channel = SCOUT_CHANNELS.get(mode)
+        if channel is not None and pts:
+            source, kind = channel
+            out.append(LedgerEvent(
+                frame=frame,
+                source=source,
+                kind=kind,
+                payload={"points_xy": pts}
+            ))
 
-        # Language events (when present)
-        if src == "language":
+    # Surveyor surface points
+    def _surveyor(self, frame, snap, out):
+        pts = snap.get("surface_points_xy", [])
+        if pts:
             out.append(LedgerEvent(
                 frame=frame,
-                source="language",
-                kind="language_event",
-                payload=snap
+                source="surveyor",
+                kind="surface_points",
+                payload={"points_xy": pts}
             ))
 
-        return out
\ No newline at end of file
+    # Language events (when present)
+    def _language(self, frame, snap, out):
+        out.append(LedgerEvent(
+            frame=frame,
+            source="language",
+            kind="language_event",
+            payload=snap
+        ))
@@ -1,25 +1,67 @@
-from dataclasses import dataclass, asdict
+from collections import deque
+import sys
 from typing import Dict, Any, List
-from world_core.sandys_square import coherence_gate
+import numpy as np
+from world_core.sandys_square import CoherenceTracker
+from world_core.ledger_store import EventStore, PACKED_POINTS, pack_points, split_payload, join_payload
+from world_core.ledger_segments import SegmentWriter, SegmentReader
+from world_core.ledger_gates import GateParams, evaluate_gates
 
-@dataclass
 class LedgerEvent:
-    frame: int
-    source: str
-    kind: str
-    payload: Dict[str, Any]
+    """
+    Compact ledger event: interned source/kind, points_xy as an int16 (n, 2)
+    array (`points`), the rest of the payload (if any) in `extra`.
+    The payload dict is only rebuilt on demand (payload / to_dict).
+    """
+    __slots__ = ("frame", "source", "kind", "points", "extra")
+
+    def __init__(self, frame: int, source: str, kind: str, payload: Dict[str, Any] = None, points=None):
+        self.frame = int(frame)
+        self.source = sys.intern(source)
+        self.kind = sys.intern(kind)
+        if points is None:
+            self.points, self.extra = split_payload(payload)
+            return
+        # points handed over directly (e.g. an integer array from a bot)
+        self.points = pack_points(points if isinstance(points, list) else np.asarray(points))
+        if self.points is None:
+            raise ValueError("points must be integer (x, y) pairs within int16")
+        self.extra = None
+        if payload:
+            _, rest = split_payload({k: v for k, v in payload.items() if k != "points_xy"})
+            self.extra = dict(rest, points_xy=PACKED_POINTS)
+
+    @property
+    def payload(self):
+        pts = None if self.points is None else [tuple(xy) for xy in self.points.tolist()]
+        return join_payload(pts, self.extra)
 
     def to_dict(self):
-        return asdict(self)
+        return {"frame": self.frame, "source": self.source, "kind": self.kind, "payload": self.payload}
 
 class Ledger:
     """
     Stores events and computes Sandy gates from numeric evidence.
     """
-    def __init__(self):
-        self.events: List[Dict[str, Any]] = []
-        self._recent_points = []  # for SandySquare coherence
-        self._max_points = 400
+    def __init__(self, retain_events: int = 100_000, chunk_size: int = 4096, spill_dir=None, gate_params: GateParams = None):
+        # columnar store; `events` is a lazy list-like view of dicts
+        self._store = EventStore(chunk_size=chunk_size, retain_events=retain_events)
+        self.events = self._store.view()
+
+        # optional full history on disk (append-only segments)
+        self.spill_dir = spill_dir
+        self._spill = SegmentWriter(spill_dir) if spill_dir else None
+        # gate thresholds/weights/windows (ledger_replay re-evaluates logs with others)
+        self.gate_params = gate_params or GateParams()
+
+        # SandySquare coherence over the last max_points reaction points (incremental)
+        self._max_points = self.gate_params.max_points
+        self._coherence = CoherenceTracker(max_points=self._max_points, grid_size=self.gate_params.grid_size)
+
+        # rolling per-kind counts over the last `_window` events (gate evidence)
+        self._window = self.gate_params.window
+        self._window_kinds = deque()
+        self._kind_counts: Dict[str, int] = {}
 
         # gates + scores
         self.object_stability = 0.0
@@ -33,55 +75,126 @@ class Ledger:
         self.language_ready = False
 
     def ingest(self, ev: LedgerEvent):
-        d = ev.to_dict()
-        self.events.append(d)
+        self.ingest_many((ev,))
+
+    def ingest_many(self, events):
+        """
+        Append a batch of events (e.g. one frame's) with a single window,
+        counter and coherence update.
+        """
+        events = list(events)
+        if not events:
+            return
+        for ev in events:
+            self._store.append(ev.frame, ev.source, ev.kind, ev.points, ev.extra)
+            if self._spill is not None:
+                self._spill.append(ev.frame, ev.source, ev.kind, ev.points, ev.extra)
+        self._count_in([ev.kind for ev in events])
 
         # Collect “reaction points” from sensors:
         # - walker interactions
         # - scout peaks
         # - surveyor surface hits
-        p = d.get("payload", {})
-        pts = p.get("points_xy")
-        if isinstance(pts, list):
-            for xy in pts:
-                if isinstance(xy, (list, tuple)) and len(xy) == 2:
-                    self._recent_points.append((int(xy[0]), int(xy[1])))
-
-        if len(self._recent_points) > self._max_points:
-            self._recent_points = self._recent_points[-self._max_points:]
+        batch = []
+        for ev in events:
+            if ev.points is not None:
+                batch.append(ev.points)
+                continue
+            # points that didn't pack (floats, out of int16 range) stay in extra
+            pts = ev.extra.get("points_xy") if isinstance(ev.extra, dict) else None
+            if isinstance(pts, list):
+                valid = [xy for xy in pts if isinstance(xy, (list, tuple)) and len(xy) == 2]
+                if valid:
+                    # the ledger's reaction points are int()-truncated (like the packed ones)
+                    batch.append(np.asarray(valid).reshape(-1, 2).astype(np.int64))
+        if batch:
+            self._coherence.extend(np.concatenate(batch) if len(batch) > 1 else batch[0])
+
+    def _count_in(self, kinds):
+        counts = self._kind_counts
+        self._window_kinds.extend(kinds)
+        for kind in kinds:
+            counts[kind] = counts.get(kind, 0) + 1
+        while len(self._window_kinds) > self._window:
+            old = self._window_kinds.popleft()
+            counts[old] -= 1
+            if not counts[old]:
+                del counts[old]
+
+    def window_count(self, kind: str) -> int:
+        """
+        Events of `kind` among the last gate_params.window (default 200, as tail(200)).
+        """
+        return self._kind_counts.get(kind, 0)
+
+    def window_counts(self) -> Dict[str, int]:
+        return dict(self._kind_counts)
 
     def tail(self, n=50):
         return self.events[-int(n):]
 
+    @property
+    def kinds(self) -> List[str]:
+        return list(self._store.kinds)
+
+    @property
+    def sources(self) -> List[str]:
+        return list(self._store.sources)
+
+    def query(self, kind=None, source=None, frames=None, limit=None):
+        """
+        Events (dicts) by kind and/or source within frames=(a, b) inclusive,
+        oldest first; limit keeps the newest `limit`. Index + binary search,
+        no scan over the ledger.
+        """
+        seqs = self._store.select(kind=kind, source=source, frames=frames)
+        if limit is not None:
+            seqs = seqs[max(0, len(seqs) - int(limit)):]
+        return [self._store.record(int(q)) for q in seqs]
+
+    def count(self, kind=None, source=None, frames=None) -> int:
+        return self._store.count(kind=kind, source=source, frames=frames)
+
+    def counts_by_bucket(self, bucket: int = 100, frames=None, kinds=None):
+        """
+        {kind: np.ndarray of event counts per `bucket` frames}.
+        """
+        return self._store.counts_by_bucket(bucket, frames=frames, kinds=kinds)
+
+    def flush(self):
+        # push buffered events to the on-disk segments (if spilling)
+        if self._spill is not None:
+            self._spill.flush()
+
+    def history(self):
+        """
+        Memory-mapped reader over everything spilled so far (None if not spilling).
+        """
+        if self._spill is None:
+            return None
+        self._spill.flush()
+        return SegmentReader(self.spill_dir)
+
     def recompute_gates(self):
         # coherence from SandySquare (0..1)
-        coh = coherence_gate(self._recent_points, grid_size=32)
+        coh = self._coherence.coherence()
 
         # crude stability proxies:
         #  - object stability rises when we see repeated interaction + correlated field peaks
         #  - structure stability rises when surveyor produces consistent surface points
         #  - symbol readiness rises when object stability and coherence are high
         #  - language readiness rises later
-
-        recent = self.tail(200)
-
-        walker_hits = sum(1 for e in recent if e["kind"] == "walker_interaction")
-        sound_hits = sum(1 for e in recent if e["kind"] == "sound_peaks")
-        light_hits = sum(1 for e in recent if e["kind"] == "light_peaks")
-        surf_hits = sum(1 for e in recent if e["kind"] == "surface_points")
-
-        # normalize to 0..1
-        self.object_stability = min(1.0, 0.25*min(1.0, walker_hits/6) + 0.25*min(1.0, sound_hits/8) + 0.25*min(1.0, light_hits/8) + 0.25*coh)
-        self.structure_stability = min(1.0, 0.6*min(1.0, surf_hits/10) + 0.4*coh)
-
-        self.symbol_readiness = min(1.0, 0.65*self.object_stability + 0.35*coh)
-        self.language_readiness = min(1.0, 0.55*self.symbol_readiness + 0.45*self.structure_stability)
-
-        # thresholds
-        self.object_stable = self.object_stability >= 0.55
-        self.structure_stable = self.structure_stability >= 0.55
-        self.symbol_ready = self.symbol_readiness >= 0.60
-        self.language_ready = self.language_readiness >= 0.75
+        # (weights, normalisers and thresholds: self.gate_params)
+        gates = evaluate_gates(
+            self.gate_params,
+            self.window_count("walker_interaction"),
+            self.window_count("sound_peaks"),
+            self.window_count("light_peaks"),
+            self.window_count("surface_points"),
+            coh,
+        )
+        for name, value in gates.items():
+            setattr(self, name, value)
 
     def gates_snapshot(self):
         return {
@@ -93,4 +206,15 @@ class Ledger:
             "structure_stable": bool(self.structure_stable),
             "symbol_ready": bool(self.symbol_ready),
             "language_ready": bool(self.language_ready),
-        }
\ No newline at end of file
+        }
+
+    def snapshot(self):
+        return {
+            "gates": self.gates_snapshot(),
+            "events_retained": len(self.events),
+            "events_total": self._store.total,
+            "store_bytes": self._store.nbytes,
+            "window_counts": self.window_counts(),
+            "coherence": self._coherence.coherence(),
+            "spill_dir": self.spill_dir,
+        }
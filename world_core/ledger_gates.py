@@ -0,0 +1,72 @@
+# world_core/ledger_gates.py
+
+from dataclasses import dataclass
+
+import numpy as np
+
+GATE_SCORES = ("object_stability", "structure_stability", "symbol_readiness", "language_readiness")
+GATE_FLAGS = ("object_stable", "structure_stable", "symbol_ready", "language_ready")
+
+
+@dataclass(frozen=True)
+class GateParams:
+    """
+    Everything Sandy's gates depend on. Defaults are the live Ledger's values.
+    """
+    # evidence windows
+    window: int = 200          # events counted per kind
+    max_points: int = 400      # reaction points in the coherence window
+    grid_size: int = 32        # SandySquare grid
+
+    # hit counts that saturate each evidence term
+    walker_norm: float = 6.0
+    sound_norm: float = 8.0
+    light_norm: float = 8.0
+    surface_norm: float = 10.0
+
+    # score weights
+    object_walker_w: float = 0.25
+    object_sound_w: float = 0.25
+    object_light_w: float = 0.25
+    object_coherence_w: float = 0.25
+    structure_surface_w: float = 0.6
+    structure_coherence_w: float = 0.4
+    symbol_object_w: float = 0.65
+    symbol_coherence_w: float = 0.35
+    language_symbol_w: float = 0.55
+    language_structure_w: float = 0.45
+
+    # thresholds
+    object_threshold: float = 0.55
+    structure_threshold: float = 0.55
+    symbol_threshold: float = 0.60
+    language_threshold: float = 0.75
+
+
+def evaluate_gates(params: GateParams, walker_hits, sound_hits, light_hits, surf_hits, coh):
+    """
+    Gate scores + flags from window counts and coherence.
+    Works on scalars or on broadcastable arrays (frames x parameter sets).
+    """
+    p = params
+    object_stability = np.minimum(1.0, (
+        p.object_walker_w*np.minimum(1.0, walker_hits/p.walker_norm)
+        + p.object_sound_w*np.minimum(1.0, sound_hits/p.sound_norm)
+        + p.object_light_w*np.minimum(1.0, light_hits/p.light_norm)
+        + p.object_coherence_w*coh
+    ))
+    structure_stability = np.minimum(1.0, p.structure_surface_w*np.minimum(1.0, surf_hits/p.surface_norm) + p.structure_coherence_w*coh)
+
+    symbol_readiness = np.minimum(1.0, p.symbol_object_w*object_stability + p.symbol_coherence_w*coh)
+    language_readiness = np.minimum(1.0, p.language_symbol_w*symbol_readiness + p.language_structure_w*structure_stability)
+
+    return {
+        "object_stability": object_stability,
+        "structure_stability": structure_stability,
+        "symbol_readiness": symbol_readiness,
+        "language_readiness": language_readiness,
+        "object_stable": object_stability >= p.object_threshold,
+        "structure_stable": structure_stability >= p.structure_threshold,
+        "symbol_ready": symbol_readiness >= p.symbol_threshold,
+        "language_ready": language_readiness >= p.language_threshold,
+    }
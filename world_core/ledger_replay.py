@@ -0,0 +1,233 @@
+# world_core/ledger_replay.py
+
+import json
+import os
+from types import SimpleNamespace
+
+import numpy as np
+
+from world_core.ledger_gates import GateParams, GATE_FLAGS, evaluate_gates
+from world_core.ledger_segments import SegmentReader
+
+# gate evidence kinds (see Ledger.recompute_gates)
+EVIDENCE_KINDS = ("walker_interaction", "sound_peaks", "light_peaks", "surface_points")
+
+
+class ReplayLog:
+    """
+    Columnar copy of a recorded ledger: what the gates need, nothing else.
+
+    - frame[e], kind[e] per event e (kind ids into `kinds`)
+    - points (P, 2) int reaction points in ingest order, point_event[p] = e
+    """
+
+    def __init__(self, frame, kind, kinds, points, point_event):
+        self.frame = np.asarray(frame, dtype=np.int64)
+        self.kind = np.asarray(kind, dtype=np.int64)
+        self.kinds = list(kinds)
+        self.points = np.asarray(points, dtype=np.int64).reshape(-1, 2)
+        self.point_event = np.asarray(point_event, dtype=np.int64)
+
+    def __len__(self):
+        return len(self.frame)
+
+    @classmethod
+    def from_segments(cls, reader):
+        """
+        From a SegmentReader (or its directory). Packed points are read
+        straight off the memmaps; only unpacked point payloads hit JSON.
+        """
+        if isinstance(reader, (str, os.PathLike)):
+            reader = SegmentReader(reader)
+
+        frames, kinds, points, owners = [], [], [], []
+        for k in range(len(reader.segments)):
+            base, events, pts, extras = reader.segment_columns(k)
+            frames.append(np.asarray(events["frame"], dtype=np.int64))
+            kinds.append(np.asarray(events["kind"], dtype=np.int64))
+
+            counts = np.asarray(events["pt_count"], dtype=np.int64)
+            packed = np.nonzero(counts >= 0)[0]
+            if pts is not None:
+                points.append(np.asarray(pts, dtype=np.int64).reshape(-1, 2))
+                owners.append(base + np.repeat(packed, counts[packed]))
+
+            # points_xy that didn't fit int16 stayed in the JSON extras
+            for j in np.nonzero((counts < 0) & (events["extra_off"] >= 0))[0]:
+                off, n = int(events["extra_off"][j]), int(events["extra_len"][j])
+                payload = json.loads(bytes(extras[off:off + n]).decode("utf-8"))
+                xy = _reaction_points(payload)
+                if xy:
+                    points.append(np.asarray(xy, dtype=np.int64))
+                    owners.append(np.full(len(xy), base + j, dtype=np.int64))
+
+        return cls._assemble(frames, kinds, reader.kinds, points, owners)
+
+    @classmethod
+    def from_events(cls, events):
+        """
+        From event dicts (e.g. Ledger.events, SegmentReader.records(...)).
+        """
+        kinds, kind_ids = [], {}
+        frame, kind, points, owners = [], [], [], []
+        for e, ev in enumerate(events):
+            frame.append(ev["frame"])
+            kid = kind_ids.get(ev["kind"])
+            if kid is None:
+                kid = kind_ids[ev["kind"]] = len(kinds)
+                kinds.append(ev["kind"])
+            kind.append(kid)
+            for xy in _reaction_points(ev["payload"]):
+                points.append(xy)
+                owners.append(e)
+        return cls(frame, kind, kinds, np.asarray(points, dtype=np.int64).reshape(-1, 2), owners)
+
+    @classmethod
+    def _assemble(cls, frames, kinds, kind_names, points, owners):
+        frame = np.concatenate(frames) if frames else np.zeros(0, dtype=np.int64)
+        kind = np.concatenate(kinds) if kinds else np.zeros(0, dtype=np.int64)
+        if not points:
+            return cls(frame, kind, kind_names, np.zeros((0, 2), dtype=np.int64), np.zeros(0, dtype=np.int64))
+        pts = np.concatenate(points)
+        own = np.concatenate(owners)
+        order = np.argsort(own, kind="stable")  # back into ingest order
+        return cls(frame, kind, kind_names, pts[order], own[order])
+
+
+def _reaction_points(payload):
+    # same rule as Ledger.ingest
+    pts = (payload or {}).get("points_xy") if isinstance(payload, dict) else None
+    if not isinstance(pts, list):
+        return []
+    return [(int(xy[0]), int(xy[1])) for xy in pts if isinstance(xy, (list, tuple)) and len(xy) == 2]
+
+
+def _clogc(c):
+    c = np.asarray(c, dtype=float)
+    return np.where(c > 0, c * np.log(np.maximum(c, 1.0)), 0.0)
+
+
+def coherence_series(points, max_points: int = 400, grid_size: int = 32) -> np.ndarray:
+    """
+    CoherenceTracker.coherence() after each point, for every point at once.
+
+    Per step the tracker adds point t, then drops point t - max_points; each
+    changes one cell count, so S = sum(c log c) moves by a table difference.
+    The cell count at each add/drop is an occurrence count in an index range,
+    found by binary search over (cell, index) keys.
+    """
+    pts = np.asarray(points, dtype=np.int64).reshape(-1, 2)
+    n = len(pts)
+    if n == 0:
+        return np.zeros(0, dtype=float)
+    w = int(max_points)
+    gs = int(grid_size)
+
+    x, y = pts[:, 0], pts[:, 1]
+    inside = (x >= 0) & (x < gs) & (y >= 0) & (y < gs)
+    cell = np.where(inside, y * gs + x, -1)
+    t = np.arange(n, dtype=np.int64)
+
+    keys = np.sort(cell[inside] * n + t[inside])
+
+    def occurrences(c, lo, hi):
+        # times cell c occurs at indices lo..hi (inclusive)
+        return np.searchsorted(keys, c * n + hi, side="right") - np.searchsorted(keys, c * n + lo, side="left")
+
+    delta = np.zeros(n, dtype=float)
+
+    # add point t: its cell count becomes k over [t - w, t]
+    a = np.nonzero(inside)[0]
+    k = occurrences(cell[a], np.maximum(0, a - w), a)
+    delta[a] += _clogc(k) - _clogc(k - 1)
+
+    # then drop point t - w: its cell count goes from m (over [t - w, t]) to m - 1
+    r = np.arange(max(0, n - w), dtype=np.int64)
+    r = r[inside[r]]
+    m = occurrences(cell[r], r, r + w)
+    delta[r + w] += _clogc(m - 1) - _clogc(m)
+
+    s = np.cumsum(delta)
+    in_cum = np.concatenate([[0], np.cumsum(inside)])
+    total = (in_cum[t + 1] - in_cum[np.maximum(0, t + 1 - w)]).astype(float)
+
+    coh = np.zeros(n, dtype=float)
+    ok = total > 0
+    entropy = np.log(total[ok]) - s[ok] / total[ok]
+    max_entropy = np.log(gs * gs)
+    coh[ok] = np.clip(1.0 - entropy / max_entropy, 0.0, 1.0)
+    return coh
+
+
+def window_counts(log: ReplayLog, kind: str, window: int, at) -> np.ndarray:
+    """
+    Events of `kind` among the last `window` events, as of each event index in `at`.
+    """
+    at = np.asarray(at, dtype=np.int64)
+    if kind not in log.kinds:
+        return np.zeros(len(at), dtype=np.int64)
+    cs = np.concatenate([[0], np.cumsum(log.kind == log.kinds.index(kind))])
+    return cs[at + 1] - cs[np.maximum(0, at + 1 - int(window))]
+
+
+def replay_gates(log: ReplayLog, params=None):
+    """
+    Gate time series for one or many parameter sets.
+
+    Returns {"frames": (F,), "params": [GateParams, ...], <score|flag>: (S, F)}
+    with one column per distinct recorded frame: the gates as they stood
+    once that frame's events were all in (they hold until the next one).
+    """
+    if params is None:
+        params = [GateParams()]
+    elif isinstance(params, GateParams):
+        params = [params]
+    params = list(params)
+
+    if len(log) == 0:
+        out = {"frames": np.zeros(0, dtype=np.int64), "params": params}
+        for name in evaluate_gates(GateParams(), 0, 0, 0, 0, 0.0):
+            out[name] = np.zeros((len(params), 0), dtype=bool if name in GATE_FLAGS else float)
+        return out
+
+    # last event of every frame
+    ends = np.concatenate([np.nonzero(np.diff(log.frame))[0], [len(log) - 1]])
+    frames = log.frame[ends]
+    last_point = np.searchsorted(log.point_event, ends, side="right") - 1
+
+    # evidence, computed once per distinct window / (max_points, grid_size)
+    counts = {}
+    coh = {}
+    for p in params:
+        if p.window not in counts:
+            counts[p.window] = [window_counts(log, kind, p.window, ends) for kind in EVIDENCE_KINDS]
+        ckey = (p.max_points, p.grid_size)
+        if ckey not in coh:
+            series = coherence_series(log.points, p.max_points, p.grid_size)
+            coh[ckey] = np.where(last_point >= 0, series[np.maximum(last_point, 0)] if len(series) else 0.0, 0.0)
+
+    # (S, F) evidence, (S, 1) parameters -> every set and frame in one pass
+    evidence = [np.stack([counts[p.window][i] for p in params]) for i in range(len(EVIDENCE_KINDS))]
+    c = np.stack([coh[(p.max_points, p.grid_size)] for p in params])
+    stacked = SimpleNamespace(**{
+        name: np.array([getattr(p, name) for p in params], dtype=float)[:, None]
+        for name in GateParams.__dataclass_fields__
+    })
+    out = {"frames": frames, "params": params}
+    out.update(evaluate_gates(stacked, *evidence, c))
+    return out
+
+
+def first_open_frames(result):
+    """
+    [{flag: first frame it is open, or None}, ...] per parameter set.
+    """
+    frames = result["frames"]
+    rows = []
+    for s in range(len(result["params"])):
+        row = {}
+        for flag in GATE_FLAGS:
+            hit = np.nonzero(result[flag][s])[0]
+            row[flag] = int(frames[hit[0]]) if len(hit) else None
+        rows.append(row)
+    return rows
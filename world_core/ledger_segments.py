@@ -0,0 +1,395 @@
+# world_core/ledger_segments.py
+
+import json
+import os
+import time
+import uuid
+
+import numpy as np
+
+from world_core.ledger_store import PACKED_POINTS
+
+INDEX_FILE = "index.json"
+LEDGER_RUNS_DIR = "ledger_runs"  # default home of recorded runs (one dir each)
+FORMAT_VERSION = 2  # 2: per-segment kind/source postings
+PACKED_MARK = "__points_xy__"  # where points_xy sat inside a JSON extras payload
+
+def new_run_dir(tag: str = None, root: str = LEDGER_RUNS_DIR) -> str:
+    """
+    Fresh run directory path: <root>/<timestamp>[-<tag>]-<id>. The random id
+    keeps runs started in the same second apart.
+    """
+    parts = [time.strftime("%Y%m%d-%H%M%S")] + ([tag] if tag else []) + [uuid.uuid4().hex[:8]]
+    return os.path.join(root, "-".join(parts))
+
+
+# one fixed-size record per event
+EVENT_DTYPE = np.dtype([
+    ("frame", "<i8"),
+    ("source", "<i4"),
+    ("kind", "<i4"),
+    ("pt_start", "<i8"),   # index of the first (x, y) pair in .points.bin
+    ("pt_count", "<i4"),   # -1: payload kept whole in extras
+    ("extra_off", "<i8"),  # byte offset into .extras.jsonl, -1: none
+    ("extra_len", "<i4"),
+])
+POSTING_DTYPE = np.dtype("<i4")  # segment-local event index
+
+
+def _postings_path(base: str, field: str, i) -> str:
+    return f"{base}.{field}-{i}.bin"
+
+
+class SegmentWriter:
+    """
+    Append-only on-disk ledger log in rotating segments.
+
+    Per segment NNNNNN:
+      seg-NNNNNN.events.bin   EVENT_DTYPE records
+      seg-NNNNNN.points.bin   int16 x, y pairs
+      seg-NNNNNN.extras.jsonl non-point payload parts (rare)
+      seg-NNNNNN.kind-K.bin   postings: local indices of kind id K (<i4, ascending)
+      seg-NNNNNN.source-S.bin postings: local indices of source id S
+    index.json holds the source/kind tables and per-segment counts/frame ranges
+    (postings lengths under "kind_counts"/"source_counts");
+    it is rewritten (atomically) after every flush, so readers only ever see
+    fully written events.
+
+    Opening an existing log resumes it: tables and offsets come from its
+    index, bytes past the index (an interrupted flush) are cut off, and
+    new events go to a fresh segment (each segment stays frame-ordered).
+    """
+
+    def __init__(self, root_dir: str, segment_events: int = 250_000, flush_every: int = 2048):
+        self.root_dir = str(root_dir)
+        self.segment_events = int(segment_events)
+        self.flush_every = int(flush_every)
+        os.makedirs(self.root_dir, exist_ok=True)
+
+        self.sources = []
+        self.kinds = []
+        self._source_ids = {}
+        self._kind_ids = {}
+        self.segments = []  # [{"name", "count", "points", "extras_bytes", "first_frame", "last_frame",
+                            #   "kind_counts", "source_counts"}]
+
+        self._pending = []  # (frame, source_id, kind_id, packed | None, extras_bytes | None)
+        self._resume()
+
+    def _resume(self):
+        path = os.path.join(self.root_dir, INDEX_FILE)
+        if not os.path.exists(path):
+            return
+        with open(path) as f:
+            index = json.load(f)
+        if index.get("format") != FORMAT_VERSION:
+            raise ValueError(f"{self.root_dir}: unsupported ledger format {index.get('format')!r}")
+        self.sources = list(index["sources"])
+        self.kinds = list(index["kinds"])
+        self._source_ids = {s: i for i, s in enumerate(self.sources)}
+        self._kind_ids = {k: i for i, k in enumerate(self.kinds)}
+        self.segments = list(index["segments"])
+        if self.segments:
+            seg = self.segments[-1]
+            base = os.path.join(self.root_dir, seg["name"])
+            self._truncate(base + ".events.bin", seg["count"] * EVENT_DTYPE.itemsize)
+            self._truncate(base + ".points.bin", seg["points"] * 2 * 2)
+            self._truncate(base + ".extras.jsonl", seg["extras_bytes"])
+            for field, counts in (("kind", seg["kind_counts"]), ("source", seg["source_counts"])):
+                for i, n in counts.items():
+                    self._truncate(_postings_path(base, field, i), n * POSTING_DTYPE.itemsize)
+            # a resumed run may restart its frames: never append to an old segment
+            seg["sealed"] = True
+
+    @staticmethod
+    def _truncate(path, size):
+        if os.path.exists(path) and os.path.getsize(path) > size:
+            with open(path, "r+b") as f:
+                f.truncate(size)
+
+    def append(self, frame: int, source: str, kind: str, points, extra):
+        """
+        One event, payload already split (see ledger_store.split_payload).
+        """
+        sid = self._source_ids.get(source)
+        if sid is None:
+            sid = self._source_ids[source] = len(self.sources)
+            self.sources.append(source)
+        kid = self._kind_ids.get(kind)
+        if kid is None:
+            kid = self._kind_ids[kind] = len(self.kinds)
+            self.kinds.append(kind)
+
+        if isinstance(extra, dict) and points is not None:
+            extra = {k: (PACKED_MARK if v is PACKED_POINTS else v) for k, v in extra.items()}
+        blob = None
+        if extra is not None:
+            blob = (json.dumps(extra, default=str) + "\n").encode("utf-8")
+
+        self._pending.append((int(frame), sid, kid, points, blob))
+        if len(self._pending) >= self.flush_every:
+            self.flush()
+
+    def _open_segment(self):
+        seg = {
+            "name": f"seg-{len(self.segments):06d}",
+            "count": 0,
+            "points": 0,
+            "extras_bytes": 0,
+            "first_frame": None,
+            "last_frame": None,
+            "kind_counts": {},
+            "source_counts": {},
+        }
+        # leftovers of an interrupted flush that never made it into the index
+        base = os.path.join(self.root_dir, seg["name"])
+        for ext in (".events.bin", ".points.bin", ".extras.jsonl"):
+            open(base + ext, "wb").close()
+        for name in os.listdir(self.root_dir):
+            if name.startswith((seg["name"] + ".kind-", seg["name"] + ".source-")):
+                os.remove(os.path.join(self.root_dir, name))
+        self.segments.append(seg)
+        return seg
+
+    def flush(self):
+        pending, self._pending = self._pending, []
+        while pending:
+            seg = self.segments[-1] if self.segments else None
+            if seg is None or seg.get("sealed") or seg["count"] >= self.segment_events:
+                seg = self._open_segment()
+            room = self.segment_events - seg["count"]
+            batch, pending = pending[:room], pending[room:]
+            self._write_batch(seg, batch)
+        self._write_index()
+
+    def _write_batch(self, seg, batch):
+        base = os.path.join(self.root_dir, seg["name"])
+        recs = np.zeros(len(batch), dtype=EVENT_DTYPE)
+        points = []
+        blobs = []
+        pt_next = seg["points"]
+        ex_next = seg["extras_bytes"]
+
+        for i, (frame, sid, kid, packed, blob) in enumerate(batch):
+            recs[i]["frame"] = frame
+            recs[i]["source"] = sid
+            recs[i]["kind"] = kid
+            if packed is None:
+                recs[i]["pt_count"] = -1
+            else:
+                recs[i]["pt_start"] = pt_next
+                recs[i]["pt_count"] = len(packed)
+                pt_next += len(packed)
+                points.append(np.asarray(packed, dtype=np.int16).ravel())
+            if blob is None:
+                recs[i]["extra_off"] = -1
+            else:
+                recs[i]["extra_off"] = ex_next
+                recs[i]["extra_len"] = len(blob)
+                ex_next += len(blob)
+                blobs.append(blob)
+
+        # payload files first, events last: an event never points past written data
+        with open(base + ".points.bin", "ab") as f:
+            if points:
+                f.write(np.concatenate(points).astype("<i2").tobytes())
+        with open(base + ".extras.jsonl", "ab") as f:
+            f.write(b"".join(blobs))
+        # postings before the events too (the index only counts what is written)
+        local = np.arange(seg["count"], seg["count"] + len(batch), dtype=POSTING_DTYPE)
+        for field, ids, counts in (("kind", recs["kind"], seg["kind_counts"]),
+                                   ("source", recs["source"], seg["source_counts"])):
+            for i in np.unique(ids):
+                hits = local[ids == i]
+                with open(_postings_path(base, field, int(i)), "ab") as f:
+                    f.write(hits.tobytes())
+                counts[str(int(i))] = counts.get(str(int(i)), 0) + len(hits)
+        with open(base + ".events.bin", "ab") as f:
+            f.write(recs.tobytes())
+
+        seg["count"] += len(batch)
+        seg["points"] = pt_next
+        seg["extras_bytes"] = ex_next
+        if seg["first_frame"] is None:
+            seg["first_frame"] = int(batch[0][0])
+        seg["last_frame"] = int(batch[-1][0])
+
+    def _write_index(self):
+        index = {
+            "format": FORMAT_VERSION,
+            "sources": self.sources,
+            "kinds": self.kinds,
+            "segments": self.segments,
+        }
+        path = os.path.join(self.root_dir, INDEX_FILE)
+        tmp = path + ".tmp"
+        with open(tmp, "w") as f:
+            json.dump(index, f)
+        os.replace(tmp, path)
+
+
+class SegmentReader:
+    """
+    Read-only, memory-mapped view over a SegmentWriter directory.
+    Only the index is loaded eagerly; records/points/extras are mmapped.
+    """
+
+    def __init__(self, root_dir: str):
+        self.root_dir = str(root_dir)
+        with open(os.path.join(self.root_dir, INDEX_FILE)) as f:
+            index = json.load(f)
+        if index.get("format") != FORMAT_VERSION:
+            raise ValueError(f"{self.root_dir}: unsupported ledger format {index.get('format')!r}")
+        self.sources = index["sources"]
+        self.kinds = index["kinds"]
+        self.segments = [s for s in index["segments"] if s["count"] > 0]
+
+        self._starts = np.cumsum([0] + [s["count"] for s in self.segments])
+        self._maps = {}
+
+    def __len__(self):
+        return int(self._starts[-1])
+
+    def _segment(self, k: int):
+        maps = self._maps.get(k)
+        if maps is None:
+            seg = self.segments[k]
+            base = os.path.join(self.root_dir, seg["name"])
+            events = np.memmap(base + ".events.bin", dtype=EVENT_DTYPE, mode="r", shape=(seg["count"],))
+            points = None
+            if seg["points"]:
+                points = np.memmap(base + ".points.bin", dtype="<i2", mode="r", shape=(seg["points"] * 2,))
+            extras = None
+            if seg["extras_bytes"]:
+                extras = np.memmap(base + ".extras.jsonl", dtype=np.uint8, mode="r", shape=(seg["extras_bytes"],))
+            maps = self._maps[k] = (events, points, extras)
+        return maps
+
+    def _locate(self, i: int):
+        k = int(np.searchsorted(self._starts, i, side="right")) - 1
+        return k, i - int(self._starts[k])
+
+    def segment_columns(self, k: int):
+        """
+        (base, events, points, extras) of segment k: global index of its first
+        event, its EVENT_DTYPE records, flat int16 x, y pairs (or None) and
+        extras bytes (or None), all memory-mapped.
+        """
+        events, points, extras = self._segment(k)
+        return int(self._starts[k]), events, points, extras
+
+    def frames(self, k: int) -> np.ndarray:
+        """
+        Memory-mapped frame column of segment k (non-decreasing).
+        """
+        return self._segment(k)[0]["frame"]
+
+    def record(self, i: int):
+        n = len(self)
+        if i < 0:
+            i += n
+        if not 0 <= i < n:
+            raise IndexError("ledger segment index out of range")
+        k, j = self._locate(i)
+        events, points, extras = self._segment(k)
+        rec = events[j]
+
+        pts = None
+        if rec["pt_count"] >= 0:
+            s = int(rec["pt_start"]) * 2
+            flat = points[s:s + int(rec["pt_count"]) * 2] if points is not None else []
+            pts = [(int(flat[q]), int(flat[q + 1])) for q in range(0, len(flat), 2)]
+
+        extra = None
+        if rec["extra_off"] >= 0:
+            off = int(rec["extra_off"])
+            extra = json.loads(bytes(extras[off:off + int(rec["extra_len"])]).decode("utf-8"))
+
+        if pts is None:
+            payload = extra
+        elif extra is None:
+            payload = {"points_xy": pts}
+        else:
+            payload = {key: (pts if v == PACKED_MARK else v) for key, v in extra.items()}
+
+        return {
+            "frame": int(rec["frame"]),
+            "source": self.sources[int(rec["source"])],
+            "kind": self.kinds[int(rec["kind"])],
+            "payload": payload,
+        }
+
+    def records(self, start: int, stop: int):
+        return [self.record(i) for i in range(max(0, start), min(len(self), stop))]
+
+    def tail(self, n: int = 50):
+        return self.records(len(self) - int(n), len(self))
+
+    def select(self, kind=None, source=None, frames=None) -> np.ndarray:
+        """
+        Global indices of events matching kind/source within frames=(a, b).
+        Segments outside the range are skipped via the index; inside one,
+        the kind/source postings are intersected and cut to the frame bounds
+        (binary-searched on the mmapped frame column).
+        """
+        kid = sid = None
+        if kind is not None:
+            if kind not in self.kinds:
+                return np.zeros(0, dtype=np.int64)
+            kid = self.kinds.index(kind)
+        if source is not None:
+            if source not in self.sources:
+                return np.zeros(0, dtype=np.int64)
+            sid = self.sources.index(source)
+
+        out = []
+        for k, seg in enumerate(self.segments):
+            if frames is not None and (seg["last_frame"] < frames[0] or seg["first_frame"] > frames[1]):
+                continue
+            lo, hi = 0, seg["count"]
+            if frames is not None:
+                fr = self.frames(k)
+                lo = int(np.searchsorted(fr, frames[0], side="left"))
+                hi = int(np.searchsorted(fr, frames[1], side="right"))
+            idx = None
+            for field, i in (("kind", kid), ("source", sid)):
+                if i is None:
+                    continue
+                hits = self._postings(k, field, i)
+                idx = hits if idx is None else np.intersect1d(idx, hits, assume_unique=True)
+            if idx is None:
+                idx = np.arange(lo, hi, dtype=np.int64)
+            else:
+                idx = idx[np.searchsorted(idx, lo):np.searchsorted(idx, hi)].astype(np.int64)
+            out.append(idx + int(self._starts[k]))
+        return np.concatenate(out) if out else np.zeros(0, dtype=np.int64)
+
+    def _postings(self, k: int, field: str, i: int) -> np.ndarray:
+        # memory-mapped local indices of kind/source id i in segment k
+        key = (k, field, i)
+        hits = self._maps.get(key)
+        if hits is None:
+            seg = self.segments[k]
+            n = seg[f"{field}_counts"].get(str(i), 0)
+            if n:
+                path = _postings_path(os.path.join(self.root_dir, seg["name"]), field, i)
+                hits = np.memmap(path, dtype=POSTING_DTYPE, mode="r", shape=(n,))
+            else:
+                hits = np.zeros(0, dtype=POSTING_DTYPE)
+            self._maps[key] = hits
+        return hits
+
+    def frame_range(self):
+        if not self.segments:
+            return None
+        return (self.segments[0]["first_frame"], self.segments[-1]["last_frame"])
+
+    def snapshot(self):
+        return {
+            "root_dir": self.root_dir,
+            "events": len(self),
+            "segments": len(self.segments),
+            "frame_range": self.frame_range(),
+            "kinds": list(self.kinds),
+            "sources": list(self.sources),
+        }
@@ -0,0 +1,383 @@
+# world_core/ledger_store.py
+
+from array import array
+import copy
+
+import numpy as np
+
+PACKED_POINTS = object()  # marks where points_xy sat in a payload with other keys
+_I16_MIN, _I16_MAX = -32768, 32767
+
+
+def pack_points(pts):
+    """
+    int16 (n, 2) array for [(x, y), ...] of ints (or an integer (n, 2)
+    array), or None if it doesn't fit.
+    """
+    if isinstance(pts, np.ndarray):
+        arr = pts
+    elif isinstance(pts, list) and all(isinstance(xy, tuple) and len(xy) == 2 for xy in pts):
+        if not pts:
+            return np.zeros((0, 2), dtype=np.int16)
+        arr = np.array(pts)
+    else:
+        return None
+    if arr.ndim != 2 or arr.shape[1] != 2 or arr.dtype.kind not in "biu":
+        return None
+    if arr.size and (arr.min() < _I16_MIN or arr.max() > _I16_MAX):
+        return None
+    return arr.astype(np.int16)
+
+
+def split_payload(payload):
+    """
+    (points, extra) for a raw payload: points_xy packed by pack_points (or
+    None), and a private copy of the rest -- PACKED_POINTS where points_xy
+    sat, None if there is nothing else.
+    """
+    points = pack_points(payload.get("points_xy")) if isinstance(payload, dict) else None
+    if points is None:
+        return None, copy.deepcopy(payload)
+    if len(payload) == 1:
+        return points, None
+    return points, {k: (PACKED_POINTS if k == "points_xy" else copy.deepcopy(v)) for k, v in payload.items()}
+
+
+def join_payload(points, extra):
+    """
+    Inverse of split_payload; points as [(x, y), ...] (or None). Returns a fresh dict.
+    """
+    if points is None:
+        return copy.deepcopy(extra)
+    if extra is None:
+        return {"points_xy": points}
+    return {k: (points if v is PACKED_POINTS else copy.deepcopy(v)) for k, v in extra.items()}
+
+
+class _Chunk:
+    """
+    Fixed-capacity column block: frame, source id, kind id, point offsets,
+    plus a packed int16 point buffer and a (mostly None) extras column.
+    """
+
+    def __init__(self, base_seq: int, capacity: int):
+        self.base_seq = int(base_seq)
+        self.size = 0
+        self.frame = np.zeros(capacity, dtype=np.int64)
+        self.source = np.zeros(capacity, dtype=np.int32)
+        self.kind = np.zeros(capacity, dtype=np.int32)
+        self.pt_start = np.zeros(capacity, dtype=np.int64)
+        self.pt_count = np.zeros(capacity, dtype=np.int32)  # -1: no packed points
+        self.points = array("h")
+        self.extras = [None] * capacity
+
+    @property
+    def capacity(self) -> int:
+        return len(self.frame)
+
+    @property
+    def nbytes(self) -> int:
+        cols = self.frame.nbytes + self.source.nbytes + self.kind.nbytes + self.pt_start.nbytes + self.pt_count.nbytes
+        return cols + self.points.itemsize * len(self.points)
+
+
+class _Postings:
+    """
+    Growable (seq, frame) columns for one kind or source, in append order
+    (so both columns are non-decreasing and binary-searchable).
+    """
+
+    def __init__(self, capacity: int = 256):
+        self.seq = np.zeros(capacity, dtype=np.int64)
+        self.frame = np.zeros(capacity, dtype=np.int64)
+        self.start = 0
+        self.size = 0
+
+    def append(self, seq: int, frame: int):
+        if self.size >= len(self.seq):
+            # compact away trimmed entries, then grow x2
+            live = self.size - self.start
+            cap = max(256, 2 * live)
+            for name in ("seq", "frame"):
+                col = getattr(self, name)
+                new = np.zeros(cap, dtype=np.int64)
+                new[:live] = col[self.start:self.size]
+                setattr(self, name, new)
+            self.start, self.size = 0, live
+        self.seq[self.size] = seq
+        self.frame[self.size] = frame
+        self.size += 1
+
+    def trim_before(self, seq: int):
+        self.start += int(np.searchsorted(self.seq[self.start:self.size], seq, side="left"))
+
+    def seqs(self) -> np.ndarray:
+        return self.seq[self.start:self.size]
+
+    def frames(self) -> np.ndarray:
+        return self.frame[self.start:self.size]
+
+    def __len__(self):
+        return self.size - self.start
+
+
+class EventStore:
+    """
+    Columnar, chunked, bounded-memory ledger event store.
+
+    - Strings (source, kind) are interned to small integer ids.
+    - points_xy payloads arrive packed (int16, see split_payload) and are kept
+      in int16 buffers; the rest of a payload sits in an extras column (None
+      for plain sensor events).
+    - retain_events bounds memory: whole oldest chunks are dropped once the
+      retained count exceeds it (None = keep everything).
+    """
+
+    def __init__(self, chunk_size: int = 4096, retain_events=None):
+        self.chunk_size = int(chunk_size)
+        self.retain_events = None if retain_events is None else int(retain_events)
+
+        self.sources = []
+        self.kinds = []
+        self._source_ids = {}
+        self._kind_ids = {}
+
+        self._chunks = []
+        self.total = 0  # events ever appended (seq of the next event)
+
+        # secondary indexes: kind id / source id -> postings
+        self._by_kind = {}
+        self._by_source = {}
+
+    # ------------------------------------------------
+    # write
+    # ------------------------------------------------
+    def intern_source(self, source: str) -> int:
+        sid = self._source_ids.get(source)
+        if sid is None:
+            sid = self._source_ids[source] = len(self.sources)
+            self.sources.append(source)
+        return sid
+
+    def intern_kind(self, kind: str) -> int:
+        kid = self._kind_ids.get(kind)
+        if kid is None:
+            kid = self._kind_ids[kind] = len(self.kinds)
+            self.kinds.append(kind)
+        return kid
+
+    def append(self, frame: int, source: str, kind: str, points, extra) -> int:
+        """
+        Store one event (payload already split, see split_payload); returns
+        its sequence number. The store keeps `extra` as given.
+        """
+        chunk = self._chunks[-1] if self._chunks else None
+        if chunk is None or chunk.size >= chunk.capacity:
+            chunk = _Chunk(self.total, self.chunk_size)
+            self._chunks.append(chunk)
+            self._enforce_retention()
+
+        i = chunk.size
+        sid = self.intern_source(source)
+        kid = self.intern_kind(kind)
+        chunk.frame[i] = int(frame)
+        chunk.source[i] = sid
+        chunk.kind[i] = kid
+        for index, key in ((self._by_kind, kid), (self._by_source, sid)):
+            postings = index.get(key)
+            if postings is None:
+                postings = index[key] = _Postings()
+            postings.append(self.total, int(frame))
+
+        chunk.extras[i] = extra
+        if points is None:
+            chunk.pt_count[i] = -1
+        else:
+            chunk.pt_start[i] = len(chunk.points)
+            chunk.pt_count[i] = len(points)
+            chunk.points.frombytes(np.ascontiguousarray(points, dtype=np.int16).tobytes())
+
+        chunk.size += 1
+        seq = self.total
+        self.total += 1
+        return seq
+
+    def _enforce_retention(self):
+        if self.retain_events is None:
+            return
+        # keep at least retain_events (drop whole chunks only)
+        dropped = False
+        while len(self._chunks) > 1 and len(self) - self._chunks[0].size >= self.retain_events:
+            self._chunks.pop(0)
+            dropped = True
+        if dropped:
+            for postings in list(self._by_kind.values()) + list(self._by_source.values()):
+                postings.trim_before(self.first_seq)
+
+    # ------------------------------------------------
+    # read
+    # ------------------------------------------------
+    @property
+    def first_seq(self) -> int:
+        return self._chunks[0].base_seq if self._chunks else self.total
+
+    def __len__(self):
+        return self.total - self.first_seq
+
+    @property
+    def nbytes(self) -> int:
+        return sum(c.nbytes for c in self._chunks)
+
+    def _locate(self, seq: int):
+        k = (seq - self.first_seq) // self.chunk_size
+        chunk = self._chunks[k]
+        return chunk, seq - chunk.base_seq
+
+    def points(self, seq: int):
+        chunk, i = self._locate(seq)
+        n = int(chunk.pt_count[i])
+        if n < 0:
+            return None
+        s = int(chunk.pt_start[i])
+        flat = chunk.points[s:s + 2*n]
+        return [(flat[j], flat[j + 1]) for j in range(0, 2*n, 2)]
+
+    def record(self, seq: int):
+        """
+        Event `seq` as the dict shape Ledger.events always exposed.
+        """
+        chunk, i = self._locate(seq)
+        return {
+            "frame": int(chunk.frame[i]),
+            "source": self.sources[chunk.source[i]],
+            "kind": self.kinds[chunk.kind[i]],
+            "payload": join_payload(self.points(seq), chunk.extras[i]),
+        }
+
+    def view(self):
+        return EventView(self)
+
+    # ------------------------------------------------
+    # indexed queries
+    # ------------------------------------------------
+    def seq_range(self, frames=None):
+        """
+        [lo, hi) seq range of retained events with frame in [a, b] (binary search).
+        """
+        lo, hi = self.first_seq, self.total
+        if frames is None or not self._chunks:
+            return lo, hi
+        a, b = frames
+        return self._frame_bound(a, "left"), self._frame_bound(b, "right")
+
+    def _frame_bound(self, frame, side):
+        firsts = [int(c.frame[0]) for c in self._chunks]  # one per chunk
+        k = max(0, int(np.searchsorted(firsts, frame, side=side)) - 1)
+        # the boundary can sit at the end of chunk k or the start of k+1
+        while k < len(self._chunks):
+            c = self._chunks[k]
+            j = int(np.searchsorted(c.frame[:c.size], frame, side=side))
+            if j < c.size:
+                return c.base_seq + j
+            k += 1
+        return self.total
+
+    def _postings(self, kind=None, source=None):
+        out = []
+        if kind is not None:
+            kid = self._kind_ids.get(kind)
+            out.append(self._by_kind.get(kid) if kid is not None else None)
+        if source is not None:
+            sid = self._source_ids.get(source)
+            out.append(self._by_source.get(sid) if sid is not None else None)
+        return out
+
+    def select(self, kind=None, source=None, frames=None) -> np.ndarray:
+        """
+        Seq numbers of retained events matching kind/source within frames=(a, b).
+        """
+        postings = self._postings(kind, source)
+        if not postings:
+            lo, hi = self.seq_range(frames)
+            return np.arange(lo, hi, dtype=np.int64)
+        if any(p is None for p in postings):
+            return np.zeros(0, dtype=np.int64)
+
+        result = None
+        for p in postings:
+            seqs = p.seqs()
+            if frames is not None:
+                fr = p.frames()
+                seqs = seqs[np.searchsorted(fr, frames[0], side="left"):np.searchsorted(fr, frames[1], side="right")]
+            result = seqs if result is None else np.intersect1d(result, seqs, assume_unique=True)
+        return result
+
+    def count(self, kind=None, source=None, frames=None) -> int:
+        postings = self._postings(kind, source)
+        if len(postings) == 1:
+            p = postings[0]
+            if p is None:
+                return 0
+            if frames is None:
+                return len(p)
+            fr = p.frames()
+            return int(np.searchsorted(fr, frames[1], side="right") - np.searchsorted(fr, frames[0], side="left"))
+        return int(len(self.select(kind=kind, source=source, frames=frames)))
+
+    def counts_by_bucket(self, bucket: int, frames=None, kinds=None):
+        """
+        {kind: counts per frame bucket} over frames=(a, b) (default: retained range).
+        Bucket i covers frames [a + i*bucket, a + (i+1)*bucket).
+        """
+        if frames is None:
+            if not len(self):
+                return {}
+            lo_chunk, hi_chunk = self._chunks[0], self._chunks[-1]
+            frames = (int(lo_chunk.frame[0]), int(hi_chunk.frame[hi_chunk.size - 1]))
+        a, b = int(frames[0]), int(frames[1])
+        bucket = max(1, int(bucket))
+        n_buckets = (b - a) // bucket + 1
+
+        out = {}
+        for kind in (kinds if kinds is not None else self.kinds):
+            kid = self._kind_ids.get(kind)
+            counts = np.zeros(n_buckets, dtype=np.int64)
+            p = self._by_kind.get(kid) if kid is not None else None
+            if p is not None:
+                fr = p.frames()
+                fr = fr[np.searchsorted(fr, a, side="left"):np.searchsorted(fr, b, side="right")]
+                counts += np.bincount((fr - a) // bucket, minlength=n_buckets)[:n_buckets]
+            out[kind] = counts
+        return out
+
+
+class EventView:
+    """
+    Lazy, list-like view over the retained events (dicts built on access).
+    """
+
+    def __init__(self, store: EventStore):
+        self._store = store
+
+    def __len__(self):
+        return len(self._store)
+
+    def __getitem__(self, idx):
+        n = len(self._store)
+        first = self._store.first_seq
+        if isinstance(idx, slice):
+            return [self._store.record(first + i) for i in range(*idx.indices(n))]
+        i = int(idx)
+        if i < 0:
+            i += n
+        if not 0 <= i < n:
+            raise IndexError("ledger event index out of range")
+        return self._store.record(first + i)
+
+    def __iter__(self):
+        first = self._store.first_seq
+        for i in range(len(self._store)):
+            yield self._store.record(first + i)
+
+    def __bool__(self):
+        return len(self._store) > 0
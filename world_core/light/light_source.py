@@ -7,10 +7,12 @@ class LightSource:
         self.base_level = float(base_level)
         self.active = False
         self.color = "red"
+        self.version = 0  # bumped on every state change (field caches key on it)
 
     def set_active(self, active: bool, color: str = "red"):
         self.active = bool(active)
         self.color = str(color)
+        self.version += 1
 
     def level(self) -> float:
         return round(self.base_level if self.active else 0.0, 3)
\ No newline at end of file
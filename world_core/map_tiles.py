@@ -0,0 +1,212 @@
+# world_core/map_tiles.py
+
+from collections import OrderedDict
+import math
+
+import numpy as np
+
+from world_core.spatial_index import SpatialIndex
+
+
+class MapTilePyramid:
+    """
+    Level-of-detail tile pyramid for the aerial map.
+
+    - Level 0 is one tile over the (square) world extent; level L has
+      2^L x 2^L tiles, every tile tile_px x tile_px occupancy pixels.
+    - Tiles are rasterized lazily from the grid's registered objects and
+      kept in an LRU cache; registering/moving an object only drops the
+      cached tiles its box touches.
+    - A view (centre + zoom) only builds the tiles it shows.
+    """
+
+    def __init__(self, grid, tile_px: int = 64, max_level: int = 10, max_tiles: int = 1024):
+        self.grid = grid
+        self.tile_px = int(tile_px)
+        self.max_level = int(max_level)
+        self.max_tiles = int(max_tiles)
+
+        self.origin_xy = (0.0, 0.0)
+        self.size_m = 1.0
+        self._index = SpatialIndex()
+        self._entries = {}            # id(obj) -> _Box (last known 2D box)
+        self._tiles = OrderedDict()   # (level, tx, ty) -> uint8 raster
+        self.built = 0                # tiles rasterized so far
+        self._rebuild()
+
+    # ------------------------------------------------
+    # registration hooks (called by WorldGrid)
+    # ------------------------------------------------
+    def on_register(self, obj):
+        box = self.grid.object_box(obj)
+        if not self._covers(box):
+            self._rebuild()
+            return
+        self._index.insert(self._index_entry(obj, box))
+        self._invalidate_box(box)
+
+    def on_moved(self, obj=None):
+        if obj is None:
+            # unknown object(s) moved: nothing to narrow the damage to
+            self._rebuild()
+            return
+        entry = self._entries.get(id(obj))
+        box = self.grid.object_box(obj)
+        if entry is None or not self._covers(box):
+            self._rebuild()
+            return
+        old = entry.box
+        self._index.update(self._index_entry(obj, box))
+        self._invalidate_box(old)
+        self._invalidate_box(box)
+
+    # ------------------------------------------------
+    # tiles
+    # ------------------------------------------------
+    def tile_size_m(self, level: int) -> float:
+        return self.size_m / (2 ** int(level))
+
+    def tile_bounds(self, level: int, tx: int, ty: int):
+        ts = self.tile_size_m(level)
+        x0 = self.origin_xy[0] + tx * ts
+        y0 = self.origin_xy[1] + ty * ts
+        return x0, y0, x0 + ts, y0 + ts
+
+    def tile(self, level: int, tx: int, ty: int) -> np.ndarray:
+        key = (int(level), int(tx), int(ty))
+        t = self._tiles.get(key)
+        if t is not None:
+            self._tiles.move_to_end(key)
+            return t
+
+        t = self._rasterize(*key)
+        self._tiles[key] = t
+        while len(self._tiles) > self.max_tiles:
+            self._tiles.popitem(last=False)
+        self.built += 1
+        return t
+
+    def level_for_zoom(self, zoom: float, size: int) -> int:
+        # finest level whose pixels are not (much) smaller than the view's pixels
+        need = max(1.0, float(zoom) * float(size) / self.tile_px)
+        return max(0, min(self.max_level, int(math.ceil(math.log2(need)))))
+
+    def render_view(self, center=None, zoom: float = 1.0, size: int = 256) -> np.ndarray:
+        """
+        size x size occupancy raster for a viewport (centre + zoom).
+        zoom=1 shows the whole pyramid extent.
+        """
+        if center is None:
+            center = (self.origin_xy[0] + self.size_m/2, self.origin_xy[1] + self.size_m/2)
+        span = self.size_m / max(1e-6, float(zoom))
+        px = span / size
+        pxs = float(center[0]) - span/2 + (np.arange(size) + 0.5) * px
+        pys = float(center[1]) - span/2 + (np.arange(size) + 0.5) * px
+
+        level = self.level_for_zoom(zoom, size)
+        ts = self.tile_size_m(level)
+        last = 2 ** level - 1
+        tile_px_m = ts / self.tile_px
+
+        out = np.zeros((size, size), dtype=float)
+        tx_of = np.floor((pxs - self.origin_xy[0]) / ts).astype(int)
+        ty_of = np.floor((pys - self.origin_xy[1]) / ts).astype(int)
+        for ty in np.unique(ty_of[(ty_of >= 0) & (ty_of <= last)]):
+            rows = np.nonzero(ty_of == ty)[0]
+            for tx in np.unique(tx_of[(tx_of >= 0) & (tx_of <= last)]):
+                cols = np.nonzero(tx_of == tx)[0]
+                t = self.tile(level, int(tx), int(ty))
+                x0, y0, _, _ = self.tile_bounds(level, tx, ty)
+                cx = np.clip(((pxs[cols] - x0) / tile_px_m).astype(int), 0, self.tile_px - 1)
+                cy = np.clip(((pys[rows] - y0) / tile_px_m).astype(int), 0, self.tile_px - 1)
+                out[np.ix_(rows, cols)] = t[np.ix_(cy, cx)]
+        return out
+
+    def snapshot(self):
+        return {
+            "origin_xy": self.origin_xy,
+            "size_m": self.size_m,
+            "tile_px": self.tile_px,
+            "cached_tiles": len(self._tiles),
+            "built_tiles": self.built,
+        }
+
+    # ------------------------------------------------
+    # internals
+    # ------------------------------------------------
+    def _rebuild(self):
+        # (re)fit a square root extent around the world, drop every tile
+        bounds = self.grid.world_bounds()
+        if bounds is None:
+            min_x, min_y, max_x, max_y = 0.0, 0.0, 1.0, 1.0
+        else:
+            min_x, min_y, max_x, max_y = bounds
+        size = max(1.0, max_x - min_x, max_y - min_y) * 1.25  # headroom for growth
+        cx = (min_x + max_x) / 2
+        cy = (min_y + max_y) / 2
+        self.origin_xy = (cx - size/2, cy - size/2)
+        self.size_m = size
+
+        self._index = SpatialIndex(cell_m=size / 64)
+        self._entries = {}
+        for o in self.grid.objects:
+            box = self.grid.object_box(o)
+            self._index.insert(self._index_entry(o, box))
+        self._tiles = OrderedDict()
+
+    def _index_entry(self, obj, box):
+        entry = self._entries.get(id(obj))
+        if entry is None:
+            entry = _Box(obj, box)
+            self._entries[id(obj)] = entry
+        entry.set_box(box)
+        return entry
+
+    def _covers(self, box):
+        x0, y0 = self.origin_xy
+        return box[0] >= x0 and box[1] >= y0 and box[2] <= x0 + self.size_m and box[3] <= y0 + self.size_m
+
+    def _invalidate_box(self, box):
+        for key in list(self._tiles.keys()):
+            bx0, by0, bx1, by1 = self.tile_bounds(*key)
+            if box[0] <= bx1 and box[2] >= bx0 and box[1] <= by1 and box[3] >= by0:
+                del self._tiles[key]
+
+    def _rasterize(self, level, tx, ty):
+        n = self.tile_px
+        x0, y0, x1, y1 = self.tile_bounds(level, tx, ty)
+        px = (x1 - x0) / n
+
+        hits = self._index.query_box((x0, y0, -math.inf), (x1, y1, math.inf))
+        if not hits:
+            return np.zeros((n, n), dtype=np.uint8)
+
+        b = np.array([h.box for h in hits], dtype=float)
+        c0 = np.clip(np.floor((b[:, 0] - x0) / px).astype(int), 0, n - 1)
+        c1 = np.clip(np.floor((b[:, 2] - x0) / px).astype(int), 0, n - 1)
+        r0 = np.clip(np.floor((b[:, 1] - y0) / px).astype(int), 0, n - 1)
+        r1 = np.clip(np.floor((b[:, 3] - y0) / px).astype(int), 0, n - 1)
+
+        diff = np.zeros((n + 1, n + 1), dtype=np.int32)
+        np.add.at(diff, (r0, c0), 1)
+        np.add.at(diff, (r0, c1 + 1), -1)
+        np.add.at(diff, (r1 + 1, c0), -1)
+        np.add.at(diff, (r1 + 1, c1 + 1), 1)
+        return (diff.cumsum(axis=0).cumsum(axis=1)[:n, :n] > 0).astype(np.uint8)
+
+
+class _Box:
+    """
+    Index entry: a registered object's 2D box as a (flat) WorldObject-like bound.
+    """
+    def __init__(self, obj, box):
+        self.obj = obj
+        self.set_box(box)
+
+    def set_box(self, box):
+        self.box = box
+        self.bounds = ((box[0], box[1], 0.0), (box[2], box[3], 0.0))
+
+    def contains_world_point(self, xyz):
+        x, y, _ = xyz
+        return self.box[0] <= x <= self.box[2] and self.box[1] <= y <= self.box[3]
@@ -1,20 +1,45 @@
+from world_core.delta_snapshot import DeltaEncoder
+
 class ObserverBot:
     """
     Passive perception layer.
+    Snapshots follow the delta protocol (world_core/delta_snapshot.py).
     """
-    def __init__(self, name="Observer"):
+    def __init__(self, name="Observer", keyframe_every: int = 100):
         self.name = name
         self.last = {}
+        self._delta = DeltaEncoder(keyframe_every=keyframe_every)
+        self._places_seen = []
+        self._places_version = None
+        self._weather = None  # raw world-space values world_space was last built from
 
     def observe(self, world):
-        # Observe world space + a small summary of emitters (no heavy payloads)
-        self.last = {
-            "source": "observer",
-            "name": self.name,
-            "frame": world.frame,
-            "world_space": world.space.snapshot() if hasattr(world, "space") else {},
-            "places_seen": list(world.places.keys())[:10],
-        }
+        keyframe = self._delta.keyframe_due
+        fields = {"source": "observer", "name": self.name, "frame": world.frame}
+
+        # Observe world space + a small summary of emitters (no heavy payloads);
+        # between keyframes only what moved is built
+        space = getattr(world, "space", None)
+        if space is None:
+            fields["world_space"] = {}
+        else:
+            weather = (space.daylight, space.wind, space.rain, space.snow, space.temperature)
+            if keyframe or weather != self._weather:
+                self._weather = weather
+                fields["world_space"] = space.snapshot()
+            else:
+                fields["world_space"] = {"frame": space.frame_counter}
+
+        # places only change with the geometry (builder mutations)
+        version = getattr(world, "geometry_version", None)
+        if version is None or version != self._places_version:
+            self._places_seen = list(world.places.keys())[:10]
+            self._places_version = version
+            fields["places_seen"] = self._places_seen
+        elif keyframe:
+            fields["places_seen"] = self._places_seen
+
+        self.last = self._delta.encode(fields)
 
     def snapshot(self):
-        return self.last or {"source": "observer", "name": self.name}
\ No newline at end of file
+        return self.last or {"source": "observer", "name": self.name}
@@ -33,6 +33,10 @@ class TVProfile:
             return base
         return base / (d*d)
 
+    def emitter(self, mode):
+        # the source behind sound_level_at / light_level_at (position + level())
+        return self.sound if mode == "sound" else self.light
+
     def sound_level_at(self, p_xyz):
         base = self.sound.level()
         return min(1.0, self._attenuate(p_xyz, base))
@@ -14,17 +14,16 @@ class ReceptionBot:
         for name, place in world.places.items():
             self.registry["places"][name] = getattr(place, "snapshot", lambda: {"name": name})()
 
-            # rooms/objects if present
-            if hasattr(place, "rooms"):
-                for rname, room in place.rooms.items():
-                    self.registry["rooms"][rname] = room.snapshot()
-                    if hasattr(room, "objects"):
-                        for oname, obj in room.objects.items():
-                            # may not have snapshot
-                            if hasattr(obj, "snapshot"):
-                                self.registry["objects"][f"{rname}:{oname}"] = obj.snapshot()
-                            else:
-                                self.registry["objects"][f"{rname}:{oname}"] = {"name": str(obj)}
+        # rooms/objects straight from the world registries
+        for rname, room in world.rooms.items():
+            self.registry["rooms"][rname] = room.snapshot()
+
+        for key, obj in world.objects.items():
+            # may not have snapshot
+            if hasattr(obj, "snapshot"):
+                self.registry["objects"][key] = obj.snapshot()
+            else:
+                self.registry["objects"][key] = {"name": str(obj)}
 
     def snapshot(self):
         return {
@@ -0,0 +1,141 @@
+# world_core/run.py
+#
+# Headless simulation runner (no Streamlit):
+#   python -m world_core.run --frames 5000 --seed 1
+#   python -m world_core.run --frames 100000 --until-gate symbol_ready --out ledger_runs/nightly-20260101
+#
+# Writes <out>/run.json (throughput, per-phase timings, gates) and, unless
+# --no-ledger, the ledger segments next to it (readable by the Ledger
+# Inspector page and world_core.gate_sweep). --out must not hold a previous run.
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+from world_core.bootstrap import build_world
+from world_core.ledger_gates import GATE_FLAGS
+from world_core.ledger_segments import INDEX_FILE, LEDGER_RUNS_DIR, new_run_dir
+from world_core.world_clock import WorldClock
+
+RESULT_FILE = "run.json"
+
+
+def run(frames: int = 1000, until_gate: str = None, out_dir: str = None, seed: int = None,
+        minutes_per_step: int = 1, approve=(), record_ledger: bool = True, progress_every: int = 0):
+    """
+    Build a world, tick it `frames` times (or until `until_gate` opens),
+    and return the result dict (also written to out_dir/run.json).
+    """
+    if until_gate is not None and until_gate not in GATE_FLAGS:
+        raise ValueError(f"unknown gate: {until_gate} (one of {', '.join(GATE_FLAGS)})")
+    if seed is not None:
+        random.seed(seed)
+    if out_dir is None:
+        out_dir = new_run_dir("headless")
+    # one run per directory: a second run would mix its frames into the first's log
+    for name in (INDEX_FILE, RESULT_FILE):
+        if os.path.exists(os.path.join(out_dir, name)):
+            raise FileExistsError(f"{out_dir} already holds a run ({name}); pick a new --out")
+    os.makedirs(out_dir, exist_ok=True)
+
+    clock = WorldClock(acceleration=1)
+    world = build_world(clock, ledger_dir=out_dir if record_ledger else None)
+    for key in approve:
+        world.manager.manual_approve(key)
+    world.enable_phase_timing()
+
+    first_open = {flag: None for flag in GATE_FLAGS}
+    stopped = "frames"
+    t0 = time.perf_counter()
+    for _ in range(int(frames)):
+        clock.tick(minutes=int(minutes_per_step))
+        world.tick()
+
+        ledger = world.ledger
+        for flag in GATE_FLAGS:
+            if first_open[flag] is None and getattr(ledger, flag):
+                first_open[flag] = world.frame
+        if progress_every and world.frame % progress_every == 0:
+            rate = world.frame / max(1e-9, time.perf_counter() - t0)
+            print(f"frame {world.frame}  {rate:,.0f} fps  events {ledger.snapshot()['events_total']}", file=sys.stderr)
+        if until_gate is not None and first_open[until_gate] is not None:
+            stopped = f"gate:{until_gate}"
+            break
+    elapsed = time.perf_counter() - t0
+    world.ledger.flush()
+
+    n = world.frame
+    phase_total = sum(world.phase_times.values())
+    result = {
+        "frames": n,
+        "stopped": stopped,
+        "seed": seed,
+        "minutes_per_step": int(minutes_per_step),
+        "approved": list(approve),
+        "elapsed_s": elapsed,
+        "fps": n / elapsed if elapsed > 0 else None,
+        "phases": {
+            phase: {
+                "seconds": secs,
+                "ms_per_frame": 1000.0 * secs / max(1, n),
+                "share": secs / phase_total if phase_total > 0 else 0.0,
+            }
+            for phase, secs in sorted(world.phase_times.items(), key=lambda kv: -kv[1])
+        },
+        "first_open": first_open,
+        "gates": world.ledger.gates_snapshot(),
+        "ledger": world.ledger.snapshot(),
+    }
+    with open(os.path.join(out_dir, RESULT_FILE), "w") as f:
+        json.dump(result, f, indent=2, default=str)
+    result["out_dir"] = out_dir
+    return result
+
+
+def _report(result):
+    lines = [
+        f"{result['frames']} frames in {result['elapsed_s']:.2f}s  ->  {result['fps']:,.1f} fps  (stopped: {result['stopped']})",
+        "phase          ms/frame   share",
+    ]
+    for phase, p in result["phases"].items():
+        lines.append(f"  {phase:<12} {p['ms_per_frame']:8.3f}  {100 * p['share']:5.1f}%")
+    opened = ", ".join(f"{k}@{v}" for k, v in result["first_open"].items() if v is not None) or "none"
+    lines.append(f"gates opened: {opened}")
+    lines.append(f"results: {os.path.join(result['out_dir'], RESULT_FILE)}")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Run the world headless and report throughput.")
+    ap.add_argument("--frames", type=int, default=1000, help="frames to run (the cap with --until-gate)")
+    ap.add_argument("--until-gate", choices=GATE_FLAGS, default=None, help="stop once this gate opens")
+    ap.add_argument("--out", default=None, help=f"new output dir (default: {LEDGER_RUNS_DIR}/<timestamp>-headless-<id>)")
+    ap.add_argument("--seed", type=int, default=None)
+    ap.add_argument("--minutes-per-step", type=int, default=1)
+    ap.add_argument("--approve", action="append", default=[],
+                    choices=["neighbourhood", "population", "architect", "builder"], help="manager approval (repeatable)")
+    ap.add_argument("--no-ledger", action="store_true", help="don't record ledger segments")
+    ap.add_argument("--progress-every", type=int, default=0, help="print progress every N frames (stderr)")
+    args = ap.parse_args(argv)
+
+    try:
+        result = run(
+            frames=args.frames,
+            until_gate=args.until_gate,
+            out_dir=args.out,
+            seed=args.seed,
+            minutes_per_step=args.minutes_per_step,
+            approve=args.approve,
+            record_ledger=not args.no_ledger,
+            progress_every=args.progress_every,
+        )
+    except FileExistsError as e:
+        ap.error(str(e))
+    print(_report(result))
+
+
+if __name__ == "__main__":
+    main()
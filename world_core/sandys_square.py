@@ -1,3 +1,5 @@
+import math
+
 import numpy as np
 
 def coherence_gate(points_xy, grid_size: int = 32):
@@ -31,4 +33,88 @@ def coherence_gate(points_xy, grid_size: int = 32):
     # coherence is inverse entropy, softened
     coherence = 1.0 - entropy_norm
     coherence = float(max(0.0, min(1.0, coherence)))
-    return coherence
\ No newline at end of file
+    return coherence
+
+class CoherenceTracker:
+    """
+    Incremental coherence_gate over a sliding window of the last max_points.
+    Keeps the occupancy counts, the in-grid total and sum(c * log c), so
+    entropy = log(T) - S / T is available at constant cost per point.
+    Points go into a ring buffer of cell ids; a batch (extend) only
+    touches S for the cells whose counts actually changed.
+    """
+
+    _RESYNC_EVERY = 10000  # recompute S exactly now and then (float drift)
+
+    def __init__(self, max_points: int = 400, grid_size: int = 32):
+        self.max_points = int(max_points)
+        self.grid_size = int(grid_size)
+        self._ring = np.full(self.max_points, -1, dtype=np.int64)  # cell id per point, -1: off grid
+        self._head = 0   # next ring slot
+        self.size = 0    # points in the window
+        self.counts = np.zeros(self.grid_size * self.grid_size, dtype=np.int64)
+        self.total = 0
+        self._clogc = 0.0
+        self._updates = 0
+
+    def add(self, x, y):
+        self.extend(((x, y),))
+
+    def extend(self, points_xy):
+        """
+        Add points in order (list of (x, y) or an (n, 2) array); the oldest
+        fall out of the window.
+        """
+        xy = np.asarray(points_xy).reshape(-1, 2)
+        if not len(xy):
+            return
+        gs, w = self.grid_size, self.max_points
+        x, y = xy[:, 0], xy[:, 1]
+        # bounds on the raw values (like coherence_gate), then truncate like int()
+        inside = (x >= 0) & (x < gs) & (y >= 0) & (y < gs)
+        cells = np.where(inside, y.astype(np.int64) * gs + x.astype(np.int64), -1)
+        self._updates += len(cells)
+
+        # points that enter and leave within this batch change nothing
+        cells = cells[-w:]
+        n = len(cells)
+        overflow = self.size + n - w
+        if overflow > 0:
+            tail = self._head - self.size
+            evicted = self._ring[(tail + np.arange(overflow)) % w]
+        else:
+            evicted = cells[:0]
+        self._ring[(self._head + np.arange(n)) % w] = cells
+        self._head = (self._head + n) % w
+        self.size = min(w, self.size + n)
+
+        g = len(self.counts)
+        delta = np.bincount(cells[cells >= 0], minlength=g) - np.bincount(evicted[evicted >= 0], minlength=g)
+        touched = np.nonzero(delta)[0]
+        if len(touched):
+            old = self.counts[touched]
+            new = old + delta[touched]
+            self._clogc += _clogc(new) - _clogc(old)
+            self.counts[touched] = new
+            self.total += int(delta[touched].sum())
+
+        if self._updates >= self._RESYNC_EVERY:
+            self._updates = 0
+            self._clogc = _clogc(self.counts)
+
+    def coherence(self) -> float:
+        """
+        Same value as coherence_gate(<last max_points points>, grid_size).
+        """
+        if not self.size or self.total <= 0:
+            return 0.0
+        t = float(self.total)
+        entropy = math.log(t) - self._clogc / t
+        max_entropy = math.log(self.grid_size * self.grid_size)
+        entropy_norm = entropy / max_entropy if max_entropy > 0 else 1.0
+        return float(max(0.0, min(1.0, 1.0 - entropy_norm)))
+
+
+def _clogc(c) -> float:
+    c = c[c > 0].astype(float)
+    return float(np.sum(c * np.log(c)))
@@ -1,19 +1,22 @@
 from dataclasses import dataclass, field
 from typing import Tuple, Dict, Any, List
 import numpy as np
-import math
+
+from world_core.field_engine import grid_axes, falloff_kernel, apply_kernel, peak_points
 
 @dataclass
 class ScoutBot:
     """
     Sensor scout: builds a 2D grid around center_xyz.
     mode: "sound" or "light"
+    mode="multi" + channels=("sound", "light", ...): one pass into a C x n x n tensor
     """
     name: str
     mode: str
     center_xyz: Tuple[float, float, float]
     extent_m: float = 40.0
     resolution_m: float = 2.0
+    channels: Tuple[str, ...] = ()
 
     active: bool = True
     frames: int = 0
@@ -21,65 +24,98 @@ class ScoutBot:
     grid: np.ndarray = field(default_factory=lambda: np.zeros((1, 1), dtype=float))
     peak_points_xy: List[Tuple[int, int]] = field(default_factory=list)
 
+    # stacked per-channel grids (C x n x n) + per-channel peaks
+    tensor: np.ndarray = field(default_factory=lambda: np.zeros((1, 1, 1), dtype=float))
+    peaks_by_channel: Dict[str, List[Tuple[int, int]]] = field(default_factory=dict)
+
+    # change-driven cache: (channel, emitter id) -> ((version, position), contribution)
+    _geometry_key: Tuple = field(default=(), repr=False)
+    _contrib: Dict[Tuple[str, int], Tuple[Tuple, np.ndarray]] = field(default_factory=dict, repr=False)
+    # static geometry: emitter id -> (position, unit falloff kernel), shared by all channels
+    _kernels: Dict[int, Tuple[Tuple, np.ndarray]] = field(default_factory=dict, repr=False)
+
+    def channel_list(self) -> Tuple[str, ...]:
+        return tuple(self.channels) if self.channels else (self.mode,)
+
     def observe(self, world):
         if not self.active:
             return
         self.frames += 1
 
-        cx, cy, cz = self.center_xyz
-        r = float(self.extent_m)
-        step = float(self.resolution_m)
+        channels = self.channel_list()
+        _, _, cz = self.center_xyz
+        n, xs, ys = grid_axes(self.center_xyz, self.extent_m, self.resolution_m)
+
+        # Scout moved/reconfigured => every kernel + cached contribution is stale
+        geometry_key = (tuple(self.center_xyz), float(self.extent_m), float(self.resolution_m), channels)
+        changed = set()
+        if geometry_key != self._geometry_key or self.tensor.shape != (len(channels), n, n):
+            self._geometry_key = geometry_key
+            self._contrib = {}
+            self._kernels = {}
+            changed = set(channels)
+
+        # Emitters come from the world registry (no place/room/object walk).
+        # Only emitters whose state version (or position) moved are re-sampled.
+        live = {}
+        kernels = {}
+        for ch in channels:
+            for obj in world.emitters_of(ch):
+                src = obj.emitter(ch)
+                pos = tuple(obj.position)
+
+                # inverse-square math runs once per (scout geometry, emitter position),
+                # whatever number of channels the emitter feeds
+                kernel = kernels.get(id(obj)) or self._kernels.get(id(obj))
+                if kernel is None or kernel[0] != pos:
+                    kernel = (pos, falloff_kernel(xs, ys, cz, pos))
+                kernels[id(obj)] = kernel
 
-        n = int((2*r) / step)
-        n = max(8, min(128, n))
-        grid = np.zeros((n, n), dtype=float)
+                state = (src.version, pos)
+                cached = self._contrib.get((ch, id(obj)))
+                if cached is None or cached[0] != state:
+                    cached = (state, apply_kernel(kernel[1], src.level()))
+                    changed.add(ch)
+                live[(ch, id(obj))] = cached
+        self._kernels = kernels
 
-        # Gather sources
-        sources = []
-        for place in world.places.values():
-            if not hasattr(place, "rooms"):
+        for key in self._contrib.keys() - live.keys():
+            changed.add(key[0])  # emitter left the world
+        self._contrib = live
+
+        if not changed:
+            # nothing changed: reuse last grids + peaks
+            return
+
+        tensor = np.zeros((len(channels), n, n), dtype=float)
+        for c, ch in enumerate(channels):
+            if ch not in changed:
+                tensor[c] = self.tensor[c]
                 continue
-            for room in place.rooms.values():
-                if not hasattr(room, "objects"):
-                    continue
-                for obj in room.objects.values():
-                    if self.mode == "sound" and hasattr(obj, "sound_level_at"):
-                        sources.append(("sound", obj))
-                    if self.mode == "light" and hasattr(obj, "light_level_at"):
-                        sources.append(("light", obj))
-
-        # Sample grid
-        for iy in range(n):
-            y = cy - r + iy * step
-            for ix in range(n):
-                x = cx - r + ix * step
-                val = 0.0
-                for _, obj in sources:
-                    if self.mode == "sound":
-                        val += obj.sound_level_at((x, y, cz))
-                    else:
-                        val += obj.light_level_at((x, y, cz))
-                grid[iy, ix] = min(1.0, val)
-
-        self.grid = grid
-
-        # peak points for ledger (top K cells)
-        flat = grid.flatten()
-        if flat.size > 0:
-            k = min(12, flat.size)
-            idx = np.argpartition(flat, -k)[-k:]
-            pts = []
-            for i in idx:
-                iy = int(i // n)
-                ix = int(i % n)
-                if grid[iy, ix] >= 0.25:
-                    # map to 32x32 for SandySquare
-                    gx = int((ix / max(1, n-1)) * 31)
-                    gy = int((iy / max(1, n-1)) * 31)
-                    pts.append((gx, gy))
-            self.peak_points_xy = pts
+            for (key_ch, _), (_, contrib) in live.items():
+                if key_ch == ch:
+                    tensor[c] += contrib
+            np.minimum(1.0, tensor[c], out=tensor[c])
+
+            # peak points for ledger (top K cells, mapped to 32x32 for SandySquare)
+            self.peaks_by_channel[ch] = peak_points(tensor[c], k=12, threshold=0.25, size=32)
+
+        self.tensor = tensor
+        self.grid = tensor[0] if len(channels) == 1 else tensor
+        self.peak_points_xy = self.peaks_by_channel.get(channels[0], [])
 
     def snapshot(self) -> Dict[str, Any]:
+        if self.channels:
+            return {
+                "source": "scout",
+                "name": self.name,
+                "mode": "multi",
+                "channels": list(self.channels),
+                "frames": self.frames,
+                "grid_shape": tuple(self.tensor.shape),
+                "peaks_by_channel": {ch: self.peaks_by_channel.get(ch, []) for ch in self.channels},
+                "grid": self.tensor,
+            }
         return {
             "source": "scout",
             "name": self.name,
@@ -88,4 +124,24 @@ class ScoutBot:
             "grid_shape": tuple(self.grid.shape),
             "peak_points_xy": self.peak_points_xy,
             "grid": self.grid,
-        }
\ No newline at end of file
+        }
+
+    def channel_snapshots(self) -> List[Dict[str, Any]]:
+        """
+        One single-mode snapshot per channel (the shape InvestigatorBot reads).
+        """
+        if not self.channels:
+            return [self.snapshot()]
+        out = []
+        for c, ch in enumerate(self.channels):
+            grid = self.tensor[c] if c < self.tensor.shape[0] else np.zeros((1, 1), dtype=float)
+            out.append({
+                "source": "scout",
+                "name": f"{self.name}-{ch.title()}",
+                "mode": ch,
+                "frames": self.frames,
+                "grid_shape": tuple(grid.shape),
+                "peak_points_xy": self.peaks_by_channel.get(ch, []),
+                "grid": grid,
+            })
+        return out
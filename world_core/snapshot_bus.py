@@ -0,0 +1,71 @@
+# world_core/snapshot_bus.py
+
+import numpy as np
+
+
+def _read_only(value):
+    # read-only view onto a producer's array (shared, never copied)
+    if isinstance(value, np.ndarray) and value.flags.writeable:
+        value = value.view()
+        value.flags.writeable = False
+    return value
+
+
+class FrameRecord:
+    """
+    Every snapshot published during one frame, in publish order.
+    Arrays inside are read-only views shared with their producers.
+    """
+
+    def __init__(self, frame: int):
+        self.frame = int(frame)
+        self.snapshots = []     # publish order (what the investigator reads)
+        self.by_producer = {}   # id(producer) -> [snap, ...]
+        self.grids = {}         # scout mode -> grid (UI)
+
+    def add(self, producer, snaps):
+        key = id(producer)
+        if key in self.by_producer:
+            name = getattr(producer, "name", producer.__class__.__name__)
+            raise RuntimeError(f"{name} already published in frame {self.frame}")
+        snaps = [{k: _read_only(v) for k, v in s.items()} if isinstance(s, dict) else s for s in snaps]
+        self.by_producer[key] = snaps
+        self.snapshots.extend(snaps)
+        for s in snaps:
+            if isinstance(s, dict) and s.get("source") == "scout" and "grid" in s:
+                self.grids[s.get("mode")] = s["grid"]
+        return snaps
+
+    def from_source(self, source: str):
+        return [s for s in self.snapshots if isinstance(s, dict) and s.get("source") == source]
+
+    def __len__(self):
+        return len(self.snapshots)
+
+
+class SnapshotBus:
+    """
+    Frame-scoped snapshot bus: each producer publishes once per frame, and
+    the UI cache, investigator and downstream layers all read the same record.
+    """
+
+    def __init__(self):
+        self.current = None   # FrameRecord being filled
+        self.latest = None    # last completed FrameRecord
+
+    def begin(self, frame: int) -> FrameRecord:
+        self.current = FrameRecord(frame)
+        return self.current
+
+    def publish(self, producer, *snaps):
+        """
+        Publish producer's snapshot(s) for the current frame; returns them as
+        stored (top-level arrays swapped for read-only views).
+        """
+        if self.current is None:
+            raise RuntimeError("no open frame (call begin first)")
+        return self.current.add(producer, snaps)
+
+    def end(self) -> FrameRecord:
+        self.latest, self.current = self.current, None
+        return self.latest
@@ -1,10 +1,12 @@
 # world_core/sound/sound_field.py
 
-import math
+from world_core.field_engine import sample_sources
+
 
 class SoundField:
     """
     Physical sound propagation field.
+    Sampling goes through field_engine.sample_sources (sound or light sources).
     """
 
     def __init__(self):
@@ -14,25 +16,11 @@ class SoundField:
         self.sources.append(source)
 
     def sample(self, x, y, z):
-        total = 0.0
-
-        for src in self.sources:
-            level = src.get_level()
-            if level <= 0:
-                continue
-
-            sx, sy, sz = src.position
-            dx = x - sx
-            dy = y - sy
-            dz = z - sz
-            dist = math.sqrt(dx*dx + dy*dy + dz*dz)
-
-            if dist < 1.0:
-                attenuation = 1.0
-            else:
-                attenuation = 1.0 / (dist * dist)
-
-            attenuation = max(attenuation, 0.02)
-            total += level * attenuation
-
-        return round(min(total, 1.0), 3)
\ No newline at end of file
+        return float(self.sample_many([(x, y, z)])[0])
+
+    def sample_many(self, points):
+        """
+        Vectorised sample(): points is [(x, y, z), ...] or an (N, 3) array.
+        Returns an (N,) array of levels.
+        """
+        return sample_sources(points, self.sources, floor=0.02)
@@ -4,9 +4,11 @@ class SoundSource:
         self.position = position
         self.base_level = float(base_level)
         self.active = False
+        self.version = 0  # bumped on every state change (field caches key on it)
 
     def set_active(self, active: bool):
         self.active = bool(active)
+        self.version += 1
 
     def level(self) -> float:
         return round(self.base_level if self.active else 0.0, 3)
\ No newline at end of file
@@ -0,0 +1,118 @@
+# world_core/spatial_index.py
+
+import math
+
+
+class SpatialIndex:
+    """
+    Uniform-grid spatial index over WorldObject.bounds.
+
+    - Objects are bucketed by the xy cells their bounds overlap.
+    - Point / box queries only test objects in the touched cells (exact 3D test).
+    - Results come back in insertion order, like iterating the source dict.
+    """
+
+    def __init__(self, cell_m: float = 50.0):
+        self.cell_m = float(cell_m)
+        self._cells = {}    # (cx, cy) -> {id(obj): obj}
+        self._entries = {}  # id(obj) -> (seq, obj, cells)
+        self._seq = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, obj):
+        return id(obj) in self._entries
+
+    def _cell_range(self, min_x, min_y, max_x, max_y):
+        c = self.cell_m
+        return (
+            range(int(math.floor(min_x / c)), int(math.floor(max_x / c)) + 1),
+            range(int(math.floor(min_y / c)), int(math.floor(max_y / c)) + 1),
+        )
+
+    def insert(self, obj, _seq=None):
+        bounds = getattr(obj, "bounds", None)
+        if bounds is None:
+            return
+        if id(obj) in self._entries:
+            self.remove(obj)
+
+        (min_x, min_y, _), (max_x, max_y, _) = bounds
+        xs, ys = self._cell_range(min_x, min_y, max_x, max_y)
+        cells = [(cx, cy) for cx in xs for cy in ys]
+        for key in cells:
+            self._cells.setdefault(key, {})[id(obj)] = obj
+
+        if _seq is None:
+            _seq = self._seq
+            self._seq += 1
+        self._entries[id(obj)] = (_seq, obj, cells)
+
+    def remove(self, obj):
+        entry = self._entries.pop(id(obj), None)
+        if entry is None:
+            return
+        for key in entry[2]:
+            bucket = self._cells.get(key)
+            if bucket is not None:
+                bucket.pop(id(obj), None)
+                if not bucket:
+                    del self._cells[key]
+
+    def update(self, obj):
+        """
+        Re-bucket after obj.bounds changed (keeps its original insertion order).
+        """
+        entry = self._entries.get(id(obj))
+        self.remove(obj)
+        self.insert(obj, _seq=entry[0] if entry is not None else None)
+
+    def _ordered(self, objs):
+        return sorted(objs, key=lambda o: self._entries[id(o)][0])
+
+    def query_point(self, xyz):
+        """
+        Objects whose bounds contain xyz.
+        """
+        x, y, _ = xyz
+        c = self.cell_m
+        bucket = self._cells.get((int(math.floor(x / c)), int(math.floor(y / c))))
+        if not bucket:
+            return []
+        return self._ordered(o for o in bucket.values() if o.contains_world_point(xyz))
+
+    def any_at(self, xyz) -> bool:
+        """
+        True if any indexed object contains xyz (no ordering, early exit).
+        """
+        x, y, _ = xyz
+        c = self.cell_m
+        bucket = self._cells.get((int(math.floor(x / c)), int(math.floor(y / c))))
+        if not bucket:
+            return False
+        return any(o.contains_world_point(xyz) for o in bucket.values())
+
+    def query_box(self, min_xyz, max_xyz):
+        """
+        Objects whose bounds overlap the box [min_xyz, max_xyz] (inclusive).
+        """
+        min_x, min_y, min_z = min_xyz
+        max_x, max_y, max_z = max_xyz
+        xs, ys = self._cell_range(min_x, min_y, max_x, max_y)
+
+        if len(xs) * len(ys) > len(self._cells):
+            # huge query box: walk the occupied buckets instead of every cell
+            buckets = [b for (cx, cy), b in self._cells.items() if cx in xs and cy in ys]
+        else:
+            buckets = [self._cells[(cx, cy)] for cx in xs for cy in ys if (cx, cy) in self._cells]
+
+        seen = {}
+        for bucket in buckets:
+            for oid, obj in bucket.items():
+                if oid in seen:
+                    continue
+                (bx0, by0, bz0), (bx1, by1, bz1) = obj.bounds
+                if bx0 <= max_x and bx1 >= min_x and by0 <= max_y and by1 >= min_y and bz0 <= max_z and bz1 >= min_z:
+                    seen[oid] = obj
+        return self._ordered(seen.values())
@@ -2,11 +2,16 @@ from dataclasses import dataclass, field
 from typing import Dict, Tuple, Any, List
 import numpy as np
 
+from world_core.field_engine import grid_axes
+from world_core.voxel_survey import VoxelVolume, boundary_points
+
 @dataclass
 class SurveyorBot:
     """
     3D geometry surveyor (lightweight).
     Produces a 2D surface slice + a small list of surface points for the ledger.
+    volumetric=True: surveys the full extent x extent x height_m box into a
+    sparse bit-packed VoxelVolume and serves the slice from it.
     """
     name: str
     center_xyz: Tuple[float, float, float]
@@ -14,62 +19,78 @@ class SurveyorBot:
     resolution_m: float = 2.0
     height_m: float = 8.0
 
+    volumetric: bool = False
+    voxel_resolution_m: float = 0.25
+    voxel_max_bytes: int = 1 << 20
+
     active: bool = True
     frames: int = 0
+    volume: Any = None
 
     _surface_slice: np.ndarray = field(default_factory=lambda: np.zeros((1, 1), dtype=float))
     _surface_points_xy: List[Tuple[int, int]] = field(default_factory=list)
     last_snapshot: Dict[str, Any] = field(default_factory=dict)
 
-    def _is_solid(self, world, x, y, z) -> bool:
-        for place in world.places.values():
-            if hasattr(place, "contains_world_point") and place.contains_world_point((x, y, z)):
-                return True
-            if hasattr(place, "rooms"):
-                for room in place.rooms.values():
-                    if room.contains_world_point((x, y, z)):
-                        return True
-        return False
+    # (world geometry_version, surveyor geometry) the cached slice was built from
+    _survey_key: Tuple = field(default=(), repr=False)
 
-    def observe(self, world):
-        if not self.active:
-            return
-        self.frames += 1
+    def _survey(self, world):
+        _, _, cz = self.center_xyz
+        n, xs, ys = grid_axes(self.center_xyz, self.extent_m, self.resolution_m)
+        z = cz + 1.0  # sample at ~human height
+
+        # Mark solid vs air on slice: rasterize every axis-aligned box that
+        # overlaps the slice (cells whose sample point lies inside the bounds)
+        surf = np.zeros((n, n), dtype=float)
+        for obj in world.solids_in_box((xs[0], ys[0], z), (xs[-1], ys[-1], z)):
+            (min_x, min_y, _), (max_x, max_y, _) = obj.bounds
+            ix0, ix1 = np.searchsorted(xs, min_x, side="left"), np.searchsorted(xs, max_x, side="right")
+            iy0, iy1 = np.searchsorted(ys, min_y, side="left"), np.searchsorted(ys, max_y, side="right")
+            surf[iy0:iy1, ix0:ix1] = 1.0
+
+        self._surface_slice = surf
+
+        # Extract a small set of boundary points (surface points), keep small
+        self._surface_points_xy = boundary_points(surf, size=32, limit=80)
 
+    def _survey_volume(self, world):
         cx, cy, cz = self.center_xyz
         r = float(self.extent_m)
-        step = float(self.resolution_m)
+        h = float(self.height_m)
 
-        n = int((2*r) / step)
-        n = max(8, min(128, n))
-        z = cz + 1.0  # sample at ~human height
+        lo = (cx - r, cy - r, cz)
+        hi = (cx + r, cy + r, cz + h)
+        boxes = [obj.bounds for obj in world.solids_in_box(lo, hi)]
+        self.volume = VoxelVolume.from_boxes(
+            boxes,
+            origin_xyz=lo,
+            size_xyz=(2*r, 2*r, h),
+            resolution_m=self.voxel_resolution_m,
+            max_bytes=self.voxel_max_bytes,
+        )
 
-        surf = np.zeros((n, n), dtype=float)
+        z = cz + 1.0  # sample at ~human height
+        self._surface_slice = self.volume.slice_at(z)
+        self._surface_points_xy = self.volume.surface_points(z, size=32, limit=80)
 
-        # Mark solid vs air on slice
-        for iy in range(n):
-            y = cy - r + iy * step
-            for ix in range(n):
-                x = cx - r + ix * step
-                surf[iy, ix] = 1.0 if self._is_solid(world, x, y, z) else 0.0
+    def observe(self, world):
+        if not self.active:
+            return
+        self.frames += 1
 
-        self._surface_slice = surf
+        step = float(self.resolution_m)
 
-        # Extract a small set of boundary points (surface points)
-        pts = []
-        for iy in range(1, n-1):
-            for ix in range(1, n-1):
-                if surf[iy, ix] == 1.0:
-                    if (
-                        surf[iy-1, ix] == 0.0 or surf[iy+1, ix] == 0.0 or
-                        surf[iy, ix-1] == 0.0 or surf[iy, ix+1] == 0.0
-                    ):
-                        gx = int((ix / max(1, n-1)) * 31)
-                        gy = int((iy / max(1, n-1)) * 31)
-                        pts.append((gx, gy))
-
-        # keep small
-        self._surface_points_xy = pts[:80]
+        # Geometry is static until the builder layer mutates the world:
+        # reuse the cached slice + surface points while nothing changed.
+        version = getattr(world, "geometry_version", None)
+        key = (version, tuple(self.center_xyz), float(self.extent_m), step)
+        key = key + (self.volumetric, float(self.voxel_resolution_m), float(self.height_m))
+        if version is None or key != self._survey_key:
+            if self.volumetric:
+                self._survey_volume(world)
+            else:
+                self._survey(world)
+            self._survey_key = key
 
         self.last_snapshot = {
             "source": "surveyor",
@@ -81,10 +102,20 @@ class SurveyorBot:
             "surface_points_xy": self._surface_points_xy,
             "surface_shape": tuple(self._surface_slice.shape),
         }
+        if self.volumetric and self.volume is not None:
+            self.last_snapshot["volume"] = self.volume.snapshot()
 
     def surface_slice_2d(self):
         return self._surface_slice if self._surface_slice.size else None
 
+    def slice_at(self, z: float):
+        # arbitrary horizontal slice (volumetric mode only)
+        return self.volume.slice_at(z) if self.volume is not None else None
+
+    def column_heights(self):
+        # top-of-solid height per column (volumetric mode only)
+        return self.volume.column_heights() if self.volume is not None else None
+
     def snapshot(self) -> Dict[str, Any]:
         return self.last_snapshot or {
             "source": "surveyor",
@@ -0,0 +1,152 @@
+# world_core/voxel_survey.py
+
+import numpy as np
+
+EMPTY = "empty"
+FULL = "full"
+
+
+def boundary_points(surf: np.ndarray, size: int = 32, limit: int = 80):
+    """
+    Solid interior cells with at least one air 4-neighbour, mapped onto a
+    size x size SandySquare (row-major order, first `limit` points).
+    """
+    n_y, n_x = surf.shape
+    solid = surf[1:-1, 1:-1] == 1.0
+    edge = solid & (
+        (surf[:-2, 1:-1] == 0.0) | (surf[2:, 1:-1] == 0.0) |
+        (surf[1:-1, :-2] == 0.0) | (surf[1:-1, 2:] == 0.0)
+    )
+    iy, ix = np.nonzero(edge)
+    iy, ix = iy[:limit], ix[:limit]
+    gx = (((ix + 1) / max(1, n_x-1)) * (size-1)).astype(int)
+    gy = (((iy + 1) / max(1, n_y-1)) * (size-1)).astype(int)
+    return [(int(x), int(y)) for x, y in zip(gx, gy)]
+
+
+class VoxelVolume:
+    """
+    Sparse, bit-packed solid/air volume.
+
+    - Voxel (ix, iy, iz) samples the point origin + (ix, iy, iz) * resolution.
+    - Each z-layer is stored as EMPTY, FULL, or an np.packbits array (8 voxels/byte).
+    - Layers with the same set of overlapping boxes share one packed array,
+      so a house with a few floors costs a handful of layers, not nz.
+    """
+
+    def __init__(self, origin_xyz, shape, resolution_m, layers):
+        self.origin_xyz = tuple(float(v) for v in origin_xyz)
+        self.shape = tuple(int(v) for v in shape)  # (nx, ny, nz)
+        self.resolution_m = float(resolution_m)
+        self._layers = layers  # list[EMPTY | FULL | packed uint8 (ny, ceil(nx/8))]
+
+    @classmethod
+    def from_boxes(cls, boxes, origin_xyz, size_xyz, resolution_m: float = 0.25, max_bytes: int = 1 << 20):
+        """
+        Rasterize axis-aligned boxes [((min_x, min_y, min_z), (max_x, max_y, max_z)), ...].
+        Resolution is coarsened (x2) until the worst case fits in max_bytes.
+        """
+        res = float(resolution_m)
+        sx, sy, sz = (float(v) for v in size_xyz)
+        while True:
+            nx, ny, nz = (max(1, int(s / res)) for s in (sx, sy, sz))
+            if nz * ny * ((nx + 7) // 8) <= max_bytes:
+                break
+            res *= 2.0
+
+        ox, oy, oz = (float(v) for v in origin_xyz)
+        xs = ox + np.arange(nx, dtype=float) * res
+        ys = oy + np.arange(ny, dtype=float) * res
+        zs = oz + np.arange(nz, dtype=float) * res
+
+        # per box: inclusive index ranges on each axis (same rule as contains_world_point)
+        spans = []
+        for (min_x, min_y, min_z), (max_x, max_y, max_z) in boxes:
+            ix0, ix1 = np.searchsorted(xs, min_x, side="left"), np.searchsorted(xs, max_x, side="right")
+            iy0, iy1 = np.searchsorted(ys, min_y, side="left"), np.searchsorted(ys, max_y, side="right")
+            iz0, iz1 = np.searchsorted(zs, min_z, side="left"), np.searchsorted(zs, max_z, side="right")
+            if ix0 < ix1 and iy0 < iy1 and iz0 < iz1:
+                spans.append((ix0, ix1, iy0, iy1, iz0, iz1))
+
+        layers = []
+        shared = {}
+        for iz in range(nz):
+            active = tuple(i for i, sp in enumerate(spans) if sp[4] <= iz < sp[5])
+            if active not in shared:
+                shared[active] = cls._pack_layer([spans[i] for i in active], nx, ny)
+            layers.append(shared[active])
+
+        return cls((ox, oy, oz), (nx, ny, nz), res, layers)
+
+    @staticmethod
+    def _pack_layer(spans, nx, ny):
+        if not spans:
+            return EMPTY
+        layer = np.zeros((ny, nx), dtype=bool)
+        for ix0, ix1, iy0, iy1, _, _ in spans:
+            layer[iy0:iy1, ix0:ix1] = True
+        if layer.all():
+            return FULL
+        return np.packbits(layer, axis=1)
+
+    # ------------------------------------------------
+    # reads
+    # ------------------------------------------------
+    @property
+    def nbytes(self) -> int:
+        seen = {}
+        for layer in self._layers:
+            if isinstance(layer, np.ndarray):
+                seen[id(layer)] = layer.nbytes
+        return sum(seen.values())
+
+    def layer_index(self, z: float) -> int:
+        iz = int(round((float(z) - self.origin_xyz[2]) / self.resolution_m))
+        return max(0, min(self.shape[2] - 1, iz))
+
+    def layer(self, iz: int) -> np.ndarray:
+        """
+        Dense bool (ny, nx) for one z-layer.
+        """
+        nx, ny, _ = self.shape
+        packed = self._layers[int(iz)]
+        if packed is EMPTY:
+            return np.zeros((ny, nx), dtype=bool)
+        if packed is FULL:
+            return np.ones((ny, nx), dtype=bool)
+        return np.unpackbits(packed, axis=1, count=nx).astype(bool)
+
+    def slice_at(self, z: float) -> np.ndarray:
+        """
+        Solid (1.0) / air (0.0) slice at height z (nearest layer).
+        """
+        return self.layer(self.layer_index(z)).astype(float)
+
+    def column_heights(self) -> np.ndarray:
+        """
+        (ny, nx) height above origin z of the top solid voxel; 0.0 where empty.
+        """
+        nx, ny, nz = self.shape
+        heights = np.zeros((ny, nx), dtype=float)
+        done = np.zeros((ny, nx), dtype=bool)
+        for iz in range(nz - 1, -1, -1):
+            if self._layers[iz] is EMPTY:
+                continue
+            hit = self.layer(iz) & ~done
+            heights[hit] = (iz + 1) * self.resolution_m
+            done |= hit
+            if done.all():
+                break
+        return heights
+
+    def surface_points(self, z: float, size: int = 32, limit: int = 80):
+        return boundary_points(self.slice_at(z), size=size, limit=limit)
+
+    def snapshot(self):
+        return {
+            "origin_xyz": self.origin_xyz,
+            "shape": self.shape,
+            "resolution_m": self.resolution_m,
+            "stored_layers": len({id(l) for l in self._layers if isinstance(l, np.ndarray)}),
+            "nbytes": self.nbytes,
+        }
@@ -1,12 +1,15 @@
 import math
 import random
 
+from world_core.delta_snapshot import DeltaEncoder
+
 class WalkerBot:
     """
     Physical walker. Returns to living room TV every return_interval frames and toggles it.
-    Emits: position, area, last_interaction, points_xy (coarse).
+    Emits: position, area, last_interaction, points_xy (coarse), as delta
+    snapshots (world_core/delta_snapshot.py).
     """
-    def __init__(self, name, start_xyz, world, return_interval=15):
+    def __init__(self, name, start_xyz, world, return_interval=15, keyframe_every: int = 100):
         self.name = name
         self.world = world
         self.return_interval = int(return_interval)
@@ -18,6 +21,11 @@ class WalkerBot:
 
         self._frame_counter = 0
 
+        self._delta = DeltaEncoder(keyframe_every=keyframe_every)
+        self._pos_key = None      # position position_xyz was last rounded from
+        self._pos_rounded = None
+        self.last = {}
+
     def tick(self, clock):
         self._frame_counter += 1
         self.last_interaction = None
@@ -30,6 +38,7 @@ class WalkerBot:
             self._wander()
 
         self._resolve_current_area()
+        self.last = self._encode()
 
     def _wander(self):
         # small random walk
@@ -37,51 +46,53 @@ class WalkerBot:
         self.position[1] += random.uniform(-1.0, 1.0)
 
     def _try_toggle_tv(self):
-        # Find any room with tv+remote, toggle remote power
-        for place in self.world.places.values():
-            if not hasattr(place, "rooms"):
-                continue
-            for room in place.rooms.values():
-                if getattr(room, "room_type", "") != "living_room":
-                    continue
-                if not hasattr(room, "objects"):
-                    continue
-                if "remote" in room.objects:
-                    # move to room center-ish
-                    (min_x, min_y, min_z), (max_x, max_y, max_z) = room.bounds
-                    self.position[0] = (min_x + max_x) / 2
-                    self.position[1] = (min_y + max_y) / 2
-                    self.position[2] = (min_z + max_z) / 2
+        # Find any living room with tv+remote (world interactive registry), toggle remote power
+        for room, key, _ in self.world.interactives:
+            if key == "remote" and getattr(room, "room_type", None) == "living_room":
+                # move to room center-ish
+                (min_x, min_y, min_z), (max_x, max_y, max_z) = room.bounds
+                self.position[0] = (min_x + max_x) / 2
+                self.position[1] = (min_y + max_y) / 2
+                self.position[2] = (min_z + max_z) / 2
 
-                    room.interact("remote", "power_toggle")
-                    self.last_interaction = "remote:power_toggle"
-                    return
+                room.interact("remote", "power_toggle")
+                self.last_interaction = "remote:power_toggle"
+                return
 
     def _resolve_current_area(self):
         xyz = tuple(self.position)
-        for place in self.world.places.values():
-            if hasattr(place, "rooms"):
-                for room in place.rooms.values():
-                    if room.contains_world_point(xyz):
-                        self.current_area = room.name
-                        return
-        for place in self.world.places.values():
-            if place.contains_world_point(xyz):
-                self.current_area = place.name
-                return
+        rooms = self.world.rooms_at(xyz)
+        if rooms:
+            self.current_area = rooms[0].name
+            return
+        places = self.world.places_at(xyz)
+        if places:
+            self.current_area = places[0].name
+            return
         self.current_area = "world"
 
-    def snapshot(self):
-        # Coarse point for SandySquare (map to 32x32)
-        px = int((self.position[0] % 64) / 2)
-        py = int((self.position[1] % 64) / 2)
-        return {
+    def _encode(self):
+        # encode once per tick (the encoder is stateful); unchanged position
+        # is only re-sent with keyframes
+        fields = {
             "source": "walker",
             "name": self.name,
             "frame": getattr(self.world, "frame", 0),
-            "position_xyz": [round(v, 2) for v in self.position],
             "current_area": self.current_area,
             "speed_m_per_min": self.speed_m_per_min,
             "last_interaction": self.last_interaction,
-            "points_xy": [(px, py)] if self.last_interaction else [],
-        }
\ No newline at end of file
+        }
+        pos_key = tuple(self.position)
+        if pos_key != self._pos_key:
+            self._pos_key = pos_key
+            self._pos_rounded = [round(v, 2) for v in self.position]
+            fields["position_xyz"] = self._pos_rounded
+        elif self._delta.keyframe_due:
+            fields["position_xyz"] = self._pos_rounded
+        if self.last_interaction:
+            # Coarse point for SandySquare (map to 32x32)
+            fields["points_xy"] = [(int((self.position[0] % 64) / 2), int((self.position[1] % 64) / 2))]
+        return self._delta.encode(fields)
+
+    def snapshot(self):
+        return self.last or {"source": "walker", "name": self.name}
@@ -1,57 +1,127 @@
 import numpy as np
 
+from world_core.map_tiles import MapTilePyramid
+
 class WorldGrid:
     """
     Registers objects and can render a coarse occupancy map.
+    World bounds, object boxes and rendered rasters are cached and only
+    rebuilt when objects are registered or move (mark_moved).
     """
     def __init__(self):
         self.objects = []
+        self.version = 0
+
+        self._boxes = None     # (N, 4) float: min_x, min_y, max_x, max_y
+        self._extent = None    # (min_x, min_y, max_x, max_y)
+        self._renders = {}     # (size, center, zoom) -> raster for current version
+        self._max_renders = 16
+        self._pyramid = None   # MapTilePyramid, built on first use
 
     def register(self, obj):
         self.objects.append(obj)
+        self._invalidate()
+        if self._pyramid is not None:
+            self._pyramid.on_register(obj)
 
-    def render_occupancy(self, size: int = 64):
-        # Find overall bounds from registered objects
-        mins = []
-        maxs = []
-        for o in self.objects:
-            if getattr(o, "bounds", None):
-                (min_x, min_y, _), (max_x, max_y, _) = o.bounds
-                mins.append((min_x, min_y))
-                maxs.append((max_x, max_y))
-            else:
-                x, y, _ = o.position
-                mins.append((x, y))
-                maxs.append((x, y))
-
-        if not mins:
-            return np.zeros((size, size), dtype=float)
+    def mark_moved(self, obj=None):
+        # an object's bounds/position changed
+        self._invalidate()
+        if self._pyramid is not None:
+            self._pyramid.on_moved(obj)  # obj=None drops the whole pyramid
+
+    def tile_pyramid(self, tile_px: int = 64) -> MapTilePyramid:
+        """
+        Lazily built LOD tile pyramid (cached across reruns with the world).
+        """
+        if self._pyramid is None:
+            self._pyramid = MapTilePyramid(self, tile_px=tile_px)
+        return self._pyramid
+
+    def _invalidate(self):
+        self.version += 1
+        self._boxes = None
+        self._extent = None
+        self._renders = {}
+
+    @staticmethod
+    def object_box(o):
+        if getattr(o, "bounds", None):
+            (min_x, min_y, _), (max_x, max_y, _) = o.bounds
+            return (min_x, min_y, max_x, max_y)
+        x, y, _ = o.position
+        return (x, y, x, y)
 
-        min_x = min(p[0] for p in mins)
-        min_y = min(p[1] for p in mins)
-        max_x = max(p[0] for p in maxs)
-        max_y = max(p[1] for p in maxs)
+    def boxes(self) -> np.ndarray:
+        if self._boxes is None:
+            self._boxes = np.array([self.object_box(o) for o in self.objects], dtype=float).reshape(-1, 4)
+        return self._boxes
 
+    def world_bounds(self):
+        """
+        (min_x, min_y, max_x, max_y) over every registered object, or None.
+        """
+        if self._extent is None and self.objects:
+            b = self.boxes()
+            self._extent = (
+                float(b[:, 0].min()), float(b[:, 1].min()),
+                float(b[:, 2].max()), float(b[:, 3].max()),
+            )
+        return self._extent
+
+    def viewport(self, center=None, zoom: float = 1.0):
+        """
+        (x0, y0, w, h) of the window shown by render_occupancy.
+        zoom=1 and no centre fits the full extent.
+        """
+        min_x, min_y, max_x, max_y = self.world_bounds()
         w = max(1.0, max_x - min_x)
         h = max(1.0, max_y - min_y)
 
-        grid = np.zeros((size, size), dtype=float)
+        zoom = max(1e-6, float(zoom))
+        vw = w / zoom
+        vh = h / zoom
+        if center is None:
+            return (min_x + (w - vw) / 2, min_y + (h - vh) / 2, vw, vh)
+        return (float(center[0]) - vw / 2, float(center[1]) - vh / 2, vw, vh)
+
+    def render_occupancy(self, size: int = 64, center=None, zoom: float = 1.0):
+        if not self.objects:
+            return np.zeros((size, size), dtype=float)
+
+        key = (int(size), None if center is None else (float(center[0]), float(center[1])), float(zoom))
+        cached = self._renders.get(key)
+        if cached is not None:
+            return cached
+
+        x0v, y0v, w, h = self.viewport(center=center, zoom=zoom)
+        b = self.boxes()
 
-        for o in self.objects:
-            if getattr(o, "bounds", None):
-                (bx0, by0, _), (bx1, by1, _) = o.bounds
-            else:
-                x, y, _ = o.position
-                bx0, by0, bx1, by1 = x, y, x, y
+        # all rectangles -> cell index ranges at once
+        x0 = np.trunc(((b[:, 0] - x0v) / w) * (size - 1)).astype(int)
+        x1 = np.trunc(((b[:, 2] - x0v) / w) * (size - 1)).astype(int)
+        y0 = np.trunc(((b[:, 1] - y0v) / h) * (size - 1)).astype(int)
+        y1 = np.trunc(((b[:, 3] - y0v) / h) * (size - 1)).astype(int)
 
-            x0 = int(((bx0 - min_x) / w) * (size - 1))
-            x1 = int(((bx1 - min_x) / w) * (size - 1))
-            y0 = int(((by0 - min_y) / h) * (size - 1))
-            y1 = int(((by1 - min_y) / h) * (size - 1))
+        # drop objects entirely outside the viewport, clamp the rest
+        keep = (x1 >= 0) & (x0 <= size - 1) & (y1 >= 0) & (y0 <= size - 1)
+        x0 = np.clip(x0[keep], 0, size - 1)
+        x1 = np.clip(x1[keep], 0, size - 1)
+        y0 = np.clip(y0[keep], 0, size - 1)
+        y1 = np.clip(y1[keep], 0, size - 1)
 
-            x0, x1 = sorted((max(0, x0), min(size-1, x1)))
-            y0, y1 = sorted((max(0, y0), min(size-1, y1)))
+        # stamp every rectangle in one pass: 2D difference array + prefix sums
+        diff = np.zeros((size + 1, size + 1), dtype=np.int32)
+        np.add.at(diff, (y0, x0), 1)
+        np.add.at(diff, (y0, x1 + 1), -1)
+        np.add.at(diff, (y1 + 1, x0), -1)
+        np.add.at(diff, (y1 + 1, x1 + 1), 1)
+        cover = diff.cumsum(axis=0).cumsum(axis=1)[:size, :size]
 
-            grid[y0:y1+1, x0:x1+1] = 1.0
+        grid = (cover > 0).astype(float)
+        grid.flags.writeable = False
 
-        return grid
\ No newline at end of file
+        if len(self._renders) >= self._max_renders:
+            self._renders.pop(next(iter(self._renders)))
+        self._renders[key] = grid
+        return grid